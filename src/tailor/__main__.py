@@ -11,7 +11,6 @@ PREFLIGHT_MODULES = [
     "matplotlib.pyplot",
     "pandas",
     "lmfit",
-    "libcst",
     "PySide6",
     "pyqtgraph",
 ]
@@ -6,28 +6,28 @@ You can fit custom models to your data to estimate best-fit parameters.
 
 import importlib.metadata
 import json
+import os
 import pathlib
 import platform
 import sys
-import tempfile
-import urllib.request
-import webbrowser
+import time
+from collections import deque
 from functools import partial
 from importlib import resources
 from textwrap import dedent
 from typing import NamedTuple, Optional
 
 import click
-import packaging
+import packaging.version
+import pandas as pd
 import pyqtgraph as pg
-from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6 import QtCore, QtGui, QtNetwork, QtWidgets
 
 from tailor import config, dialogs, project_files
 from tailor.csv_format_dialog import (
     DELIMITER_CHOICES,
     NUM_FORMAT_CHOICES,
     CSVFormatDialog,
-    FormatParameters,
 )
 from tailor.data_sheet import DataSheet
 from tailor.data_source_dialog import DataSourceDialog
@@ -41,6 +41,9 @@ from tailor.ui_tailor import Ui_MainWindow
 metadata = importlib.metadata.metadata("tailor")
 __name__ = metadata["name"]
 __version__ = metadata["version"]
+CURRENT_VERSION = packaging.version.parse(__version__)
+# resolve resource path once, not for every new window
+ICON_PATH = str(resources.files("tailor.resources") / "tailor.png")
 
 
 class TabbedWidget(NamedTuple):
@@ -49,17 +52,116 @@ class TabbedWidget(NamedTuple):
 
 
 MAX_RECENT_FILES = 5
+# delay in ms before refreshing a tab which became current
+TAB_REFRESH_DELAY = 50
 
 RELEASE_API_URL = "https://api.github.com/repos/davidfokkema/tailor/releases/latest"
 HTTP_TIMEOUT = 3
+# reuse release information for an hour, when checking for updates on launch
+UPDATE_CHECK_FILE = "update_check.json"
+UPDATE_CHECK_TTL = 3600
+# download assets for each (system, machine), in order of preference; a machine
+# of None matches all machines
+ASSET_PATTERNS = {
+    ("Darwin", "arm64"): ["apple_silicon.dmg", ".dmg"],
+    ("Darwin", "x86_64"): ["intel.dmg", ".dmg"],
+    ("Windows", None): [".msi"],
+}
 
 TAILOR_PROJECT_FILTER = "Tailor project files (*.tlr);;All files (*)"
 CSV_FILE_FILTER = "CSV files (*.csv);;Text files (*.txt);;All files (*)"
 
+ABOUT_HTML = dedent(
+    f"""
+    <p>Version {__version__}.</p>
+
+    <p>Tailor is written by David Fokkema for use in the physics lab courses at the Vrije Universiteit Amsterdam and the University of Amsterdam.</p>
+
+    <p>Tailor is free software licensed under the GNU General Public License v3.0 or later.</p>
+
+    <p>For more information, please visit:<br><a href="https://github.com/davidfokkema/tailor">https://github.com/davidfokkema/tailor</a></p>
+"""
+)
+
 pg.setConfigOption("background", "w")
 pg.setConfigOption("foreground", "k")
 
 
+def open_url(url):
+    """Open a URL in the web browser.
+
+    The webbrowser module is only imported when needed, since it is not used
+    during startup.
+
+    Args:
+        url (str): the URL to open.
+    """
+    import webbrowser
+
+    webbrowser.open(url)
+
+
+class ProjectFileSignals(QtCore.QObject):
+    """Signals emitted by a SaveProjectTask or LoadProjectTask.
+
+    A QRunnable is not a QObject, so it can't define signals itself.
+    """
+
+    saveFinished = QtCore.Signal(str, object)
+    loadFinished = QtCore.Signal(str, object, object)
+
+
+class SaveProjectTask(QtCore.QRunnable):
+    """Write a project file in a worker thread."""
+
+    def __init__(self, model, filename: str, signals: ProjectFileSignals):
+        """Initialize the task.
+
+        Args:
+            model: the project model to save. It must not be shared with the
+                GUI thread.
+            filename: the filename to save to.
+            signals: emits saveFinished(filename, exc) when done. exc is None
+                if the project was successfully saved.
+        """
+        super().__init__()
+        self.model = model
+        self.filename = filename
+        self.signals = signals
+
+    def run(self):
+        try:
+            project_files.save_model_to_path(self.model, self.filename)
+        except Exception as exc:
+            self.signals.saveFinished.emit(self.filename, exc)
+        else:
+            self.signals.saveFinished.emit(self.filename, None)
+
+
+class LoadProjectTask(QtCore.QRunnable):
+    """Read and parse a project file in a worker thread."""
+
+    def __init__(self, filename: str, signals: ProjectFileSignals):
+        """Initialize the task.
+
+        Args:
+            filename: the filename to load from.
+            signals: emits loadFinished(filename, model, exc) when done. exc is
+                None if the project file was successfully parsed.
+        """
+        super().__init__()
+        self.filename = filename
+        self.signals = signals
+
+    def run(self):
+        try:
+            model = project_files.read_model_from_path(self.filename)
+        except Exception as exc:
+            self.signals.loadFinished.emit(self.filename, None, exc)
+        else:
+            self.signals.loadFinished.emit(self.filename, model, None)
+
+
 class MainWindow(QtWidgets.QMainWindow):
     """Main user interface for the tailor app.
 
@@ -69,12 +171,21 @@ class MainWindow(QtWidgets.QMainWindow):
     """
 
     _project_filename = None
+    _project_path = None
     _recent_files_actions = None
+    _config = None
+    _config_mtime = None
     _selected_col_idx = None
     _plot_num: int
     _sheet_num: int
 
     _is_dirty = False
+    _is_saving = False
+    _is_loading = False
+    _progress_dialog = None
+    _network_manager = None
+    _open_file_dialog = None
+    _save_file_dialog = None
 
     def __init__(self, add_sheet=False):
         """Initialize the class."""
@@ -82,14 +193,30 @@ class MainWindow(QtWidgets.QMainWindow):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
-        self.setWindowIcon(
-            QtGui.QIcon(str(resources.files("tailor.resources") / "tailor.png"))
-        )
+        self.setWindowIcon(QtGui.QIcon(ICON_PATH))
+        # tabs are always closable, no need to reset this when clearing tabs
+        self.ui.tabWidget.setTabsClosable(True)
 
         if platform.system() == "Windows":
             # On Windows, the Fusion style correctly handles dark mode
             QtWidgets.QApplication.instance().setStyle("fusion")
 
+        # refreshing plots is deferred until the tab has been current for a
+        # short while, so that rapid tab changes (e.g. cycling through tabs
+        # using the keyboard) result in a single refresh
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(TAB_REFRESH_DELAY)
+        self._refresh_timer.timeout.connect(self.refresh_current_tab)
+        # tabs of a loaded project which still need to be refreshed
+        self._tabs_to_refresh = deque()
+
+        # project files are read and written in a worker thread, which
+        # reports back to the GUI thread using these signals
+        self._project_file_signals = ProjectFileSignals(self)
+        self._project_file_signals.saveFinished.connect(self.save_finished)
+        self._project_file_signals.loadFinished.connect(self.load_finished)
+
         self.connect_menu_items()
         self.connect_ui_events()
         self.setup_keyboard_shortcuts()
@@ -114,14 +241,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.actionExport_CSV.triggered.connect(self.export_csv)
         self.ui.actionPreview_Graph.triggered.connect(self.preview_graph)
         self.ui.actionExport_Graph_to_PDF.triggered.connect(
-            lambda: self.export_graph(".pdf")
+            partial(self.export_graph, ".pdf")
         )
         self.ui.actionExport_Graph_to_PNG.triggered.connect(
-            lambda: self.export_graph(".png")
+            partial(self.export_graph, ".png")
         )
         self.ui.actionClose.triggered.connect(self.new_project)
-        # use lambda to gobble 'checked' parameter
-        self.ui.actionAdd_Data_Sheet.triggered.connect(lambda: self.add_data_sheet())
+        self.ui.actionAdd_Data_Sheet.triggered.connect(self._new_data_sheet)
         self.ui.actionDuplicate_Data_Sheet.triggered.connect(self.duplicate_data_sheet)
         self.ui.actionDuplicate_Data_Sheet_With_Plots.triggered.connect(
             self.duplicate_data_sheet_with_plots
@@ -182,9 +308,14 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         self.update_recent_files()
         self.ui.actionClear_Menu.triggered.connect(self.clear_recent_files_menu)
+        # files may have been (re)moved since the menu was populated
+        self.ui.menuOpen_Recent.aboutToShow.connect(self.update_recent_files_actions)
 
     def mark_project_dirty(self, is_dirty=True):
         """Mark project as dirty or as clean."""
+        if is_dirty == self._is_dirty:
+            # called on every edit, nothing to do if the state doesn't change
+            return
         self._is_dirty = is_dirty
         self.update_window_title()
 
@@ -216,19 +347,7 @@ class MainWindow(QtWidgets.QMainWindow):
         """Show about application dialog."""
         box = QtWidgets.QMessageBox(parent=self)
         box.setText("Tailor")
-        box.setInformativeText(
-            dedent(
-                f"""
-            <p>Version {__version__}.</p>
-
-            <p>Tailor is written by David Fokkema for use in the physics lab courses at the Vrije Universiteit Amsterdam and the University of Amsterdam.</p>
-
-            <p>Tailor is free software licensed under the GNU General Public License v3.0 or later.</p>
-
-            <p>For more information, please visit:<br><a href="https://github.com/davidfokkema/tailor">https://github.com/davidfokkema/tailor</a></p>
-        """
-            )
-        )
+        box.setInformativeText(ABOUT_HTML)
         box.exec()
 
     def _on_data_sheet(self) -> Optional[DataSheet]:
@@ -325,12 +444,13 @@ class MainWindow(QtWidgets.QMainWindow):
             list[str]: a list of plot titles that use one of the columns.
         """
         data_model = sheet.model.data_model
-        plot_titles = []
-        for idx in range(self.ui.tabWidget.count()):
-            tab = self.ui.tabWidget.widget(idx)
-            if type(tab) == PlotTab and tab.model.uses(data_model, columns):
-                plot_titles.append(tab.name)
-        return plot_titles
+        # convert once, instead of once for every plot
+        columns = frozenset(columns)
+        return [
+            tab.name
+            for tab, _ in self._get_tabs()
+            if type(tab) == PlotTab and tab.model.uses(data_model, columns)
+        ]
 
     def get_columns_which_use_columns(
         self, sheet: DataSheet, columns: list[str]
@@ -349,13 +469,15 @@ class MainWindow(QtWidgets.QMainWindow):
         Returns:
             list[str]: a list of column names which use any of the columns.
         """
-        column_names = []
-        for idx in range(sheet.model.columnCount()):
+        columns = frozenset(columns)
+        data_model = sheet.model.data_model
+        labels, names = sheet.model.columnLabels(), sheet.model.columnNames()
+        return [
+            name
+            for label, name in zip(labels, names)
             # only check other columns
-            if sheet.model.columnLabel(idx) not in columns:
-                if sheet.model.columnUses(idx, columns):
-                    column_names.append(sheet.model.columnName(idx))
-        return column_names
+            if label not in columns and data_model.column_uses(label, columns)
+        ]
 
     def remove_row(self):
         """Remove a row from the current data sheet."""
@@ -380,13 +502,20 @@ class MainWindow(QtWidgets.QMainWindow):
     def tab_changed(self, idx):
         """Handle currentChanged events of the tab widget.
 
-        When the tab widget changes to a plot tab, update the plot to reflect
-        any changes to the data that might have occured.
+        When the tab widget changes to a plot tab, schedule an update of the
+        plot to reflect any changes to the data that might have occured. The
+        update is deferred until control returns to the event loop, so
+        multiple tab changes in quick succession only refresh the tab which
+        ends up being focused.
 
         Args:
             idx: an integer index of the now-focused tab.
         """
-        self.update_plot_tab(idx)
+        self._refresh_timer.start()
+
+    def refresh_current_tab(self):
+        """Refresh the currently focused tab."""
+        self.update_plot_tab(self.ui.tabWidget.currentIndex())
 
     def update_plot_tab(self, idx):
         """Update plot tab.
@@ -409,9 +538,10 @@ class MainWindow(QtWidgets.QMainWindow):
         requested plot.
         """
         if data_sheet := self._on_data_sheet():
-            dialog = self.create_plot_dialog(data_sheet)
+            labels = [None] + data_sheet.model.columnLabels()
+            names = [None] + data_sheet.model.columnNames()
+            dialog = self.create_plot_dialog(names)
             if dialog.exec() == QtWidgets.QDialog.Accepted:
-                labels = [None] + data_sheet.model.columnLabels()
                 x_var = labels[dialog.ui.x_axis_box.currentIndex()]
                 y_var = labels[dialog.ui.y_axis_box.currentIndex()]
                 x_err = labels[dialog.ui.x_err_box.currentIndex()]
@@ -468,8 +598,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.tabWidget.setCurrentIndex(idx)
         self.mark_project_dirty()
 
-    def create_plot_dialog(self, data_sheet: DataSheet) -> QtWidgets.QDialog:
-        """Create a dialog to request variables for creating a plot."""
+    def create_plot_dialog(self, choices: list[str | None]) -> QtWidgets.QDialog:
+        """Create a dialog to request variables for creating a plot.
+
+        Args:
+            choices (list[str | None]): the column names to choose from,
+                including a leading None for 'no column'.
+        """
 
         class Dialog(QtWidgets.QDialog):
             def __init__(self, parent):
@@ -477,12 +612,10 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.ui = Ui_CreatePlotDialog()
                 self.ui.setupUi(self)
 
-        choices = [None] + data_sheet.model.columnNames()
         create_dialog = Dialog(parent=self)
-        create_dialog.ui.x_axis_box.addItems(choices)
-        create_dialog.ui.y_axis_box.addItems(choices)
-        create_dialog.ui.x_err_box.addItems(choices)
-        create_dialog.ui.y_err_box.addItems(choices)
+        ui = create_dialog.ui
+        for box in ui.x_axis_box, ui.y_axis_box, ui.x_err_box, ui.y_err_box:
+            box.addItems(choices)
         return create_dialog
 
     def close_tab_with_children(self, close_idx):
@@ -536,19 +669,33 @@ class MainWindow(QtWidgets.QMainWindow):
         Returns:
             list[TabbedWidget]: a list of associated tabs.
         """
-        plots, multiplots = [], []
-        if type(tab.widget) == DataSheet:
-            # find associated plots and multiplots
-            plots = self.get_associated_plots(tab.widget)
-            for plot in plots:
-                multiplots.extend(self.get_associated_multiplots(plot.widget))
-        elif type(tab.widget) == PlotTab:
-            # find associated multiplots
-            multiplots = self.get_associated_multiplots(tab.widget)
-        else:
+        if type(tab.widget) not in (DataSheet, PlotTab):
             raise NotImplementedError(
                 f"Associated tabs for type {type(tab)} not implemented."
             )
+
+        # walk all tabs only once, sorting out plots and multiplots
+        all_plots, all_multiplots = [], []
+        for tabbed_widget in self._get_tabs():
+            if type(tabbed_widget.widget) == PlotTab:
+                all_plots.append(tabbed_widget)
+            elif type(tabbed_widget.widget) == MultiPlotTab:
+                all_multiplots.append(tabbed_widget)
+
+        if type(tab.widget) == DataSheet:
+            # find associated plots
+            plots = [p for p in all_plots if p.widget.data_sheet == tab.widget]
+            source_plots = [p.widget for p in plots]
+        else:
+            plots = []
+            source_plots = [tab.widget]
+        # find associated multiplots; a multiplot using several of the plots
+        # must only be listed once
+        multiplots = [
+            m
+            for m in all_multiplots
+            if any(m.widget.model.uses_plot(plot) for plot in source_plots)
+        ]
         return plots + multiplots
 
     def close_tabs(self, tabs: list[TabbedWidget]) -> None:
@@ -559,28 +706,36 @@ class MainWindow(QtWidgets.QMainWindow):
                 plots or multiplots).
         """
         close_idxs = [t.index for t in tabs]
-        # close from right to left to avoid jumping indexes
-        for idx in sorted(close_idxs, reverse=True):
-            self.ui.tabWidget.removeTab(idx)
+        tab_widget = self.ui.tabWidget
+        # remove all tabs in one go, without repainting or changing the focused
+        # tab in between
+        tab_widget.setUpdatesEnabled(False)
+        tab_widget.blockSignals(True)
+        try:
+            # close from right to left to avoid jumping indexes
+            for idx in sorted(close_idxs, reverse=True):
+                tab_widget.removeTab(idx)
+        finally:
+            tab_widget.blockSignals(False)
+            tab_widget.setUpdatesEnabled(True)
+        self.tab_changed(tab_widget.currentIndex())
         self.mark_project_dirty()
 
     def get_associated_plots(self, data_sheet: DataSheet) -> list[TabbedWidget]:
         """Get plots associated with a data sheet."""
-        plots = []
-        for idx in range(self.ui.tabWidget.count()):
-            tab = self.ui.tabWidget.widget(idx)
-            if type(tab) == PlotTab and tab.data_sheet == data_sheet:
-                plots.append(TabbedWidget(index=idx, widget=tab))
-        return plots
+        return [
+            tab
+            for tab in self._get_tabs()
+            if type(tab.widget) == PlotTab and tab.widget.data_sheet == data_sheet
+        ]
 
     def get_associated_multiplots(self, plot: PlotTab) -> list[TabbedWidget]:
         """Get multiplots associated with a plot."""
-        multiplots = []
-        for idx in range(self.ui.tabWidget.count()):
-            tab = self.ui.tabWidget.widget(idx)
-            if type(tab) == MultiPlotTab and tab.model.uses_plot(plot):
-                multiplots.append(TabbedWidget(index=idx, widget=tab))
-        return multiplots
+        return [
+            tab
+            for tab in self._get_tabs()
+            if type(tab.widget) == MultiPlotTab and tab.widget.model.uses_plot(plot)
+        ]
 
     def get_data_sheets(self) -> list[DataSheet]:
         """Get a list of the data sheets.
@@ -588,10 +743,7 @@ class MainWindow(QtWidgets.QMainWindow):
         Returns:
             list[DataSheet]: a list of all data sheets
         """
-        widgets = [
-            self.ui.tabWidget.widget(idx) for idx in range(self.ui.tabWidget.count())
-        ]
-        return [widget for widget in widgets if type(widget) == DataSheet]
+        return [widget for widget, _ in self._get_tabs() if type(widget) == DataSheet]
 
     def get_plots(self) -> list[PlotTab]:
         """Get a list of all plots.
@@ -599,18 +751,26 @@ class MainWindow(QtWidgets.QMainWindow):
         Returns:
             list[PlotTab]: a list of all plots.
         """
-        widgets = [
-            self.ui.tabWidget.widget(idx) for idx in range(self.ui.tabWidget.count())
-        ]
-        return [widget for widget in widgets if type(widget) == PlotTab]
+        return [widget for widget, _ in self._get_tabs() if type(widget) == PlotTab]
 
     def _count_data_sheets(self):
         """Count the number of data sheets."""
-        is_data_sheet = [
-            type(self.ui.tabWidget.widget(idx)) == DataSheet
-            for idx in range(self.ui.tabWidget.count())
+        return sum(type(widget) == DataSheet for widget, _ in self._get_tabs())
+
+    def _get_tabs(self) -> list[TabbedWidget]:
+        """Get all tabs in the tab widget.
+
+        Fetches all widgets from the tab widget in one go, so that callers can
+        iterate over a plain Python list.
+
+        Returns:
+            list[TabbedWidget]: a list of all tabbed widgets, in tab order.
+        """
+        tab_widget = self.ui.tabWidget
+        return [
+            TabbedWidget(widget=tab_widget.widget(idx), index=idx)
+            for idx in range(tab_widget.count())
         ]
-        return sum(is_data_sheet)
 
     def clear_all(self, add_sheet=False):
         """Clear all program state.
@@ -622,7 +782,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 Defaults to False.
         """
         self.ui.tabWidget.clear()
-        self.ui.tabWidget.setTabsClosable(True)
+        self._tabs_to_refresh.clear()
 
         self._plot_num = 0
         self._sheet_num = 0
@@ -658,6 +818,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.mark_project_dirty()
         return new_sheet
 
+    def _new_data_sheet(self) -> None:
+        """Add a new, empty, data sheet.
+
+        Slot for menu actions, gobbling the 'checked' parameter.
+        """
+        self.add_data_sheet()
+
     def duplicate_data_sheet(self) -> None:
         """Duplicate the current data sheet.
 
@@ -797,20 +964,38 @@ class MainWindow(QtWidgets.QMainWindow):
         """Save a Tailor project.
 
         Save all data and program state (i.e. plot tabs, fit parameters, etc.)
-        to a Tailor project file.
+        to a Tailor project file. The program state is collected here, but the
+        file is written in a worker thread. Only one save can be in flight at a
+        time.
 
         Args:
             filename: a string containing the filename to save to.
         """
+        if self._is_saving:
+            return
         try:
-            project_files.save_project_to_path(self, filename)
+            # deep copy, so the worker thread shares no state with the GUI
+            model = project_files.save_project_to_model(self).model_copy(deep=True)
         except Exception as exc:
-            dialogs.show_exception(
-                parent=self,
-                exc=exc,
-                title="Unable to save project.",
-                text="This is a bug in the application.",
+            self.show_save_exception(exc)
+        else:
+            self.set_saving(True)
+            self.show_progress_dialog("Saving project…")
+            QtCore.QThreadPool.globalInstance().start(
+                SaveProjectTask(model, filename, self._project_file_signals)
             )
+
+    def save_finished(self, filename, exc):
+        """Finish saving a project after the worker thread is done.
+
+        Args:
+            filename: a string containing the filename which was saved to.
+            exc: the exception raised while saving, or None on success.
+        """
+        self.set_saving(False)
+        self.hide_progress_dialog()
+        if exc is not None:
+            self.show_save_exception(exc)
         else:
             # remember filename for subsequent call to "Save"
             self._set_project_path(filename)
@@ -818,6 +1003,49 @@ class MainWindow(QtWidgets.QMainWindow):
             self.update_recent_files(filename)
             self.mark_project_dirty(False)
 
+    def show_save_exception(self, exc):
+        dialogs.show_exception(
+            parent=self,
+            exc=exc,
+            title="Unable to save project.",
+            text="This is a bug in the application.",
+        )
+
+    def set_saving(self, is_saving):
+        """Mark a save as in flight and disable saving until it is done."""
+        self._is_saving = is_saving
+        self.ui.actionSave.setEnabled(not is_saving)
+        self.ui.actionSave_As.setEnabled(not is_saving)
+
+    def show_progress_dialog(self, text):
+        """Show a modal progress dialog while a long task is running.
+
+        The dialog has no cancel button and shows a busy indicator. It blocks
+        user input to the main window, but keeps the event loop running.
+
+        Args:
+            text (str): the text to show in the dialog.
+        """
+        self._progress_dialog = QtWidgets.QProgressDialog(text, None, 0, 0, self)
+        self._progress_dialog.setWindowTitle("Tailor")
+        self._progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        self._progress_dialog.setMinimumDuration(0)
+        self._progress_dialog.show()
+
+    def hide_progress_dialog(self):
+        """Hide the progress dialog, if it is shown."""
+        if self._progress_dialog is not None:
+            self._progress_dialog.close()
+            self._progress_dialog.deleteLater()
+            self._progress_dialog = None
+
+    def wait_for_save(self):
+        """Block until a save in flight has finished."""
+        if self._is_saving:
+            QtCore.QThreadPool.globalInstance().waitForDone()
+            # deliver the queued saveFinished signal
+            QtWidgets.QApplication.processEvents()
+
     def open_project_dialog(self, event=None, filename=None):
         """Present open project dialog and load project."""
         if self.confirm_project_close_dialog():
@@ -836,29 +1064,69 @@ class MainWindow(QtWidgets.QMainWindow):
         Returns:
             str|None: path to the file or None.
         """
-        filename, _ = QtWidgets.QFileDialog.getOpenFileName(
-            parent=self,
-            dir=self.get_recent_directory(),
-            filter=filter,
-        )
-
-        return filename
+        if self._open_file_dialog is None:
+            self._open_file_dialog = self.create_file_dialog(
+                QtWidgets.QFileDialog.AcceptOpen
+            )
+        return self.exec_file_dialog(self._open_file_dialog, filter)
 
-    def get_save_filename_dialog(self, filter):
+    def get_save_filename_dialog(self, filter, default_suffix=None):
         """Get a filename from a 'Save File' dialog.
 
         Args:
             filter (str): available options for filtering filenames
+            default_suffix (str, optional): suffix, without the leading dot,
+                which is added to filenames without a suffix.
 
         Returns:
             str|None: path to the file or None.
         """
-        filename, _ = QtWidgets.QFileDialog.getSaveFileName(
-            parent=self,
-            dir=self.get_recent_directory(),
-            filter=filter,
-        )
-        return filename
+        if self._save_file_dialog is None:
+            self._save_file_dialog = self.create_file_dialog(
+                QtWidgets.QFileDialog.AcceptSave
+            )
+        self._save_file_dialog.setDefaultSuffix(default_suffix or "")
+        return self.exec_file_dialog(self._save_file_dialog, filter)
+
+    def create_file_dialog(self, accept_mode):
+        """Create a file dialog which is reused for subsequent calls.
+
+        Native file dialogs can be slow to open, e.g. on macOS. Set
+        `native_file_dialogs = false` in the configuration file to use Qt's
+        own dialogs instead.
+
+        Args:
+            accept_mode (QtWidgets.QFileDialog.AcceptMode): open or save files.
+
+        Returns:
+            QtWidgets.QFileDialog: the file dialog.
+        """
+        dialog = QtWidgets.QFileDialog(self)
+        dialog.setAcceptMode(accept_mode)
+        if accept_mode == QtWidgets.QFileDialog.AcceptOpen:
+            dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+        if not self._read_config().get("native_file_dialogs", True):
+            dialog.setOption(QtWidgets.QFileDialog.DontUseNativeDialog)
+        return dialog
+
+    def exec_file_dialog(self, dialog, filter):
+        """Show a file dialog in the most recent directory.
+
+        Args:
+            dialog (QtWidgets.QFileDialog): the file dialog.
+            filter (str): available options for filtering filenames
+
+        Returns:
+            str|None: path to the file or None.
+        """
+        if directory := self.get_recent_directory():
+            dialog.setDirectory(directory)
+        dialog.setNameFilter(filter)
+        dialog.selectFile("")
+        if dialog.exec() == QtWidgets.QDialog.Accepted:
+            return dialog.selectedFiles()[0]
+        else:
+            return None
 
     def get_recent_directory(self):
         """Get recent directory from config file.
@@ -866,7 +1134,7 @@ class MainWindow(QtWidgets.QMainWindow):
         Returns:
             str: the most recently visited directory.
         """
-        cfg = config.read_config()
+        cfg = self._read_config()
         return cfg.get("recent_dir", None)
 
     def set_recent_directory(self, directory):
@@ -875,9 +1143,43 @@ class MainWindow(QtWidgets.QMainWindow):
         Args:
             directory (str or pathlib.Path): the most recently visited directory.
         """
-        cfg = config.read_config()
-        cfg["recent_dir"] = str(directory)
-        config.write_config(cfg)
+        self._update_config(recent_dir=str(directory))
+
+    def _read_config(self):
+        """Read the configuration, reusing a cached copy if possible.
+
+        The configuration file is only parsed again if it was modified since
+        the last time it was read, e.g. by another instance of the app.
+
+        Returns:
+            dict: the configuration.
+        """
+        mtime = self._get_config_mtime()
+        if self._config is None or mtime != self._config_mtime:
+            self._config = config.read_config()
+            self._config_mtime = mtime
+        return self._config
+
+    def _update_config(self, **kwargs):
+        """Update the configuration and the cached copy.
+
+        Args:
+            kwargs: configuration keys and their new values.
+        """
+        self._config = config.update_config(**kwargs)
+        self._config_mtime = self._get_config_mtime()
+
+    def _get_config_mtime(self):
+        """Get the modification time of the configuration file.
+
+        Returns:
+            int | None: the modification time in nanoseconds or None if the
+                file does not exist.
+        """
+        try:
+            return config.get_config_path().stat().st_mtime_ns
+        except OSError:
+            return None
 
     def confirm_project_close_dialog(self):
         """Present a confirmation dialog before closing a project.
@@ -889,6 +1191,8 @@ class MainWindow(QtWidgets.QMainWindow):
             A boolean. If True, the user confirms closing the project. If False,
             the user wants to cancel the action.
         """
+        # a save may still be in progress, finish it before deciding anything
+        self.wait_for_save()
         if not self._is_dirty:
             # There are no changes, skip confirmation dialog
             return True
@@ -907,6 +1211,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 return True
             elif button == QtWidgets.QMessageBox.Save:
                 self.save_project_or_dialog()
+                # the project may be closed right away, so finish saving first
+                self.wait_for_save()
                 return True
             else:
                 return False
@@ -943,15 +1249,41 @@ class MainWindow(QtWidgets.QMainWindow):
         """Load a Tailor project.
 
         Load all data and program state (i.e. plot tabs, fit parameters, etc.)
-        from a Tailor project file.
+        from a Tailor project file. The file is read and parsed in a worker
+        thread while a progress dialog is shown. The project is then set up by
+        load_finished().
 
         Args:
             filename: a string containing the filename to load from.
         """
-        try:
-            self.clear_all()
-            project_files.load_project_from_path(self, filename)
-        except Exception as exc:
+        if self._is_loading:
+            return
+        self._is_loading = True
+        self.show_progress_dialog("Loading project…")
+        QtCore.QThreadPool.globalInstance().start(
+            LoadProjectTask(filename, self._project_file_signals)
+        )
+
+    def load_finished(self, filename, model, exc):
+        """Set up a project after the worker thread has parsed the file.
+
+        Args:
+            filename: a string containing the filename which was loaded from.
+            model: the project model, or None if the file could not be parsed.
+            exc: the exception raised while reading the file, or None on
+                success.
+        """
+        self._is_loading = False
+        self.hide_progress_dialog()
+
+        if exc is None:
+            try:
+                self.clear_all()
+                if model is not None:
+                    project_files.load_project_from_model(self, model)
+            except Exception as load_exc:
+                exc = load_exc
+        if exc is not None:
             dialogs.show_exception(
                 parent=self,
                 exc=exc,
@@ -962,14 +1294,43 @@ class MainWindow(QtWidgets.QMainWindow):
             # remember filename for subsequent call to "Save"
             self._set_project_path(filename)
             self.update_recent_files(filename)
-            # rebuild UI on all tabs
-            current_idx = self.ui.tabWidget.currentIndex()
-            for idx in range(self.ui.tabWidget.count()):
-                self.ui.tabWidget.setCurrentIndex(idx)
-            self.ui.tabWidget.setCurrentIndex(current_idx)
+            # rebuild UI on all tabs, without switching tabs; the current tab
+            # is refreshed first, so a pending refresh is no longer necessary
+            current_tab = self.ui.tabWidget.currentWidget()
+            tabs = [
+                tab.widget
+                for tab in self._get_tabs()
+                if type(tab.widget) == PlotTab or type(tab.widget) == MultiPlotTab
+            ]
+            tabs.sort(key=lambda widget: widget is not current_tab)
+            self._tabs_to_refresh.extend(tabs)
+            self.refresh_next_loaded_tab()
+            self._refresh_timer.stop()
             # mark project as not dirty (clean)
             self.mark_project_dirty(False)
 
+    def refresh_next_loaded_tab(self):
+        """Refresh the next tab of a loaded project.
+
+        Tabs are refreshed one at a time, so that the event loop can process
+        paint and input events in between.
+        """
+        while self._tabs_to_refresh:
+            widget = self._tabs_to_refresh.popleft()
+            # skip tabs which were closed in the meantime
+            if self.ui.tabWidget.indexOf(widget) != -1:
+                widget.refresh_ui()
+                break
+        if self._tabs_to_refresh:
+            QtCore.QTimer.singleShot(0, self.refresh_next_loaded_tab)
+
+    def wait_for_load(self):
+        """Block until a load in flight has finished."""
+        if self._is_loading:
+            QtCore.QThreadPool.globalInstance().waitForDone()
+            # deliver the queued loadFinished signal
+            QtWidgets.QApplication.processEvents()
+
     def export_csv(self):
         """Export all data as CSV.
 
@@ -999,25 +1360,30 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.set_recent_directory(pathlib.Path(filename).parent)
                     dialog = CSVFormatDialog(filename, parent=self)
                     if dialog.exec() == QtWidgets.QDialog.Accepted:
-                        format_parameters = dialog.get_format_parameters()
-                        self._do_import_csv(data_sheet, filename, format_parameters)
-
-    def _do_import_csv(
-        self, data_sheet: DataSheet, filename: str, format: FormatParameters
-    ) -> None:
-        """Import CSV data from file.
+                        if dialog.is_preview_complete():
+                            df = dialog.get_dataframe()
+                        else:
+                            # parsing large files takes a while
+                            self.show_progress_dialog("Importing data…")
+                            try:
+                                df = dialog.get_dataframe()
+                            finally:
+                                self.hide_progress_dialog()
+                        self._do_import_csv(data_sheet, df)
+
+    def _do_import_csv(self, data_sheet: DataSheet, df: pd.DataFrame) -> None:
+        """Import CSV data into a data sheet.
 
         Args:
             data_sheet (DataSheet): the data sheet into which the data will be
                 written.
-            filename: a string containing the path to the CSV file
-            format (FormatParameters): CSV format parameters
+            df (pd.DataFrame): the data read from the CSV file.
         """
         if data_sheet.model.is_empty():
             # when the data only contains empty cells, overwrite all columns
-            data_sheet.model.import_csv(filename, format)
+            data_sheet.model.import_dataframe(df)
         else:
-            data_sheet.model.merge_csv(filename, format)
+            data_sheet.model.merge_dataframe(df)
         data_sheet.ui.data_view.setCurrentIndex(data_sheet.model.createIndex(0, 0))
 
     def preview_graph(self):
@@ -1029,40 +1395,39 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.ui = Ui_PreviewDialog()
                     self.ui.setupUi(self)
 
-            with tempfile.NamedTemporaryFile(delete=False) as file:
-                try:
-                    plot.export_graph(file, dpi=100)
-                except Exception as exc:
-                    dialogs.show_exception(
-                        parent=self,
-                        exc=exc,
-                        title="Unable to preview graph.",
-                        text="It might help to check your axis labels for invalid LaTeX code.",
-                    )
-                else:
-                    dialog = Dialog(parent=self)
-                    pixmap = QtGui.QPixmap()
-                    pixmap.load(file.name)
-                    dialog.ui.label.setPixmap(pixmap)
-                    dialog.exec()
-                    # delete must be False on Windows, so remove manually
-                    file.close()
-                    pathlib.Path(file.name).unlink()
+            # render in memory, directly into a byte array which Qt can load
+            data = QtCore.QByteArray()
+            buffer = QtCore.QBuffer(data)
+            buffer.open(QtCore.QIODevice.WriteOnly)
+            try:
+                plot.export_graph(buffer, dpi=100)
+            except Exception as exc:
+                dialogs.show_exception(
+                    parent=self,
+                    exc=exc,
+                    title="Unable to preview graph.",
+                    text="It might help to check your axis labels for invalid LaTeX code.",
+                )
+            else:
+                dialog = Dialog(parent=self)
+                pixmap = QtGui.QPixmap()
+                pixmap.loadFromData(data, "PNG")
+                dialog.ui.label.setPixmap(pixmap)
+                dialog.exec()
 
     def export_graph(self, suffix):
         """Export a graph to a file.
 
-        If the user specifies a name with a different suffix an error will be
-        displayed.
+        The suffix is added to names without a suffix. If the user specifies a
+        name with a different suffix an error will be displayed.
 
         Args:
             suffix: the required suffix of the file.
         """
         if plot := self._on_plot_or_multiplot():
-            filename, _ = QtWidgets.QFileDialog.getSaveFileName(
-                parent=self,
-                dir=self.get_recent_directory(),
+            filename = self.get_save_filename_dialog(
                 filter=f"Graphics (*{suffix});;All files (*)",
+                default_suffix=suffix.lstrip("."),
             )
             if filename:
                 path = pathlib.Path(filename)
@@ -1085,6 +1450,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _set_project_path(self, filename):
         """Set window title and project name."""
         self._project_filename = filename
+        self._project_path = pathlib.Path(filename) if filename is not None else None
         self.update_window_title()
 
     def update_window_title(self):
@@ -1092,13 +1458,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         Include project name and dirty flag in the title.
         """
-        filename = self._project_filename
         title = "Tailor"
-        if filename is not None:
-            title += f": {pathlib.Path(filename).stem}"
+        if self._project_path is not None:
+            title += f": {self._project_path.stem}"
         if self._is_dirty:
             title += "*"
-        self.setWindowTitle(title)
+        # the dirty flag is set on every edit, but the title rarely changes
+        if title != self.windowTitle():
+            self.setWindowTitle(title)
 
     def update_recent_files(self, file=None):
         """Update open recent files list.
@@ -1108,70 +1475,234 @@ class MainWindow(QtWidgets.QMainWindow):
         Args:
             file (pathlib.Path or str): the most recent file which will be added to the list.
         """
-        cfg = config.read_config()
-        recents = cfg.get("recent_files", [])
+        cfg = self._read_config()
+        recents = list(cfg.get("recent_files", []))
         if file:
-            path = str(file)
-            if path in recents:
-                recents.remove(path)
-            recents.insert(0, path)
-            recents = recents[:MAX_RECENT_FILES]
-            cfg["recent_files"] = recents
-            config.write_config(cfg)
+            # move file to the front, removing an older entry if present
+            recents = list(dict.fromkeys([str(file), *recents]))[:MAX_RECENT_FILES]
+            self._update_config(recent_files=recents)
         self.populate_recent_files_menu(recents)
 
     def populate_recent_files_menu(self, recents):
         """Populate the open recent files menu.
 
-        Populate the recent files with a list of recent file names.
+        Populate the recent files with a list of recent file names. If a file
+        was added to the front of the previous list, only that file's action is
+        added and actions of files which dropped off are removed.
 
         Args:
             recents (list): A list of recent file names.
         """
-        if self._recent_files_actions:
-            for action in self._recent_files_actions:
-                self.ui.menuOpen_Recent.removeAction(action)
+        old_actions = self._recent_files_actions or []
+        old_recents = [action.data() for action in old_actions]
+        # number of old actions which are kept if a file was added to the front
+        num_kept = len(recents) - 1
+        if old_recents and recents == old_recents:
+            return
+        elif old_recents and recents and recents[1:] == old_recents[:num_kept]:
+            action = self.create_recent_file_action(recents[0])
+            self.ui.menuOpen_Recent.insertAction(old_actions[0], action)
+            for old_action in old_actions[num_kept:]:
+                self.ui.menuOpen_Recent.removeAction(old_action)
+            self._recent_files_actions = [action] + old_actions[:num_kept]
+            return
+
+        for action in old_actions:
+            self.ui.menuOpen_Recent.removeAction(action)
         if recents:
-            actions = [QtGui.QAction(f) for f in recents]
+            actions = [self.create_recent_file_action(filename) for filename in recents]
             self.ui.menuOpen_Recent.insertActions(
                 self.ui._recent_files_separator, actions
             )
-            for action in actions:
-                action.triggered.connect(
-                    partial(self.open_recent_project_action, action.text())
-                )
             self.ui.actionClear_Menu.setEnabled(True)
             self._recent_files_actions = actions
+        else:
+            self.ui.actionClear_Menu.setEnabled(False)
+            self._recent_files_actions = None
+
+    def create_recent_file_action(self, filename):
+        """Create an action to open a recent file.
+
+        Args:
+            filename (str): the name of the recent file.
+
+        Returns:
+            QtGui.QAction: the action.
+        """
+        action = QtGui.QAction(filename)
+        action.setData(filename)
+        # a single slot for all actions, which reads the filename
+        action.triggered.connect(self.open_recent_project_from_sender)
+        return action
+
+    def update_recent_files_actions(self):
+        """Disable recent files actions for files which no longer exist.
+
+        Called when the menu is about to be shown, so that startup doesn't wait
+        on (possibly slow or network) file systems. Only a single stat call per
+        recent file is needed.
+        """
+        for action in self._recent_files_actions or []:
+            action.setEnabled(os.path.isfile(action.data()))
 
     def clear_recent_files_menu(self):
         """Clear the open recent files menu."""
         for action in self._recent_files_actions:
             self.ui.menuOpen_Recent.removeAction(action)
         self._recent_files_actions = None
-        cfg = config.read_config()
-        cfg["recent_files"] = []
-        config.write_config(cfg)
+        self._update_config(recent_files=[])
         self.ui.actionClear_Menu.setEnabled(False)
 
+    def open_recent_project_from_sender(self):
+        """Open the recent project of the action which triggered this slot."""
+        self.open_recent_project_action(self.sender().data())
+
     def open_recent_project_action(self, filename):
-        if not pathlib.Path(filename).is_file():
-            dialogs.show_error_dialog(parent=self, msg="File does not exist.")
-        else:
-            if self.confirm_project_close_dialog():
-                self.load_project(filename)
+        # actions for missing files are disabled when the menu is shown
+        if self.confirm_project_close_dialog():
+            self.load_project(filename)
 
     def check_for_updates(self, silent=False):
         """Check for new releases of Tailor.
 
+        The release information is requested without blocking the event loop.
+        When it arrives, the user is informed by release_info_received().
+
         Args:
             silent (bool, optional): If there are no updates available, should
                 this method return silently? Defaults to False.
         """
-        (
-            latest_version,
-            update_link,
-            release_notes_link,
-        ) = self.get_latest_version_and_update_link()
+        cache = self.read_release_info_cache()
+        if silent and cache is not None and self.is_fresh(cache):
+            # this may be called before the event loop runs, so defer showing
+            # the release information just like a network reply would be
+            QtCore.QTimer.singleShot(
+                0, partial(self.show_update_info, cache["release_info"], silent)
+            )
+            return
+        if self._network_manager is None:
+            self._network_manager = QtNetwork.QNetworkAccessManager(self)
+        request = QtNetwork.QNetworkRequest(QtCore.QUrl(RELEASE_API_URL))
+        request.setHeader(
+            QtNetwork.QNetworkRequest.UserAgentHeader, f"tailor/{__version__}"
+        )
+        # abort the request if no data is received in time
+        request.setTransferTimeout(HTTP_TIMEOUT * 1000)
+        if cache is not None and cache.get("etag"):
+            # GitHub replies with 304 Not Modified if the release is unchanged
+            request.setRawHeader(b"If-None-Match", cache["etag"].encode())
+        reply = self._network_manager.get(request)
+        reply.finished.connect(partial(self.release_info_received, reply, silent))
+
+    def release_info_received(self, reply, silent=False):
+        """Inform the user about available updates.
+
+        Args:
+            reply (QtNetwork.QNetworkReply): the reply to the release
+                information request.
+            silent (bool, optional): If there are no updates available, should
+                this method return silently? Defaults to False.
+        """
+        reply.deleteLater()
+        if reply.error() != QtNetwork.QNetworkReply.NoError:
+            # no internet connection?
+            release_info = None
+        else:
+            etag = reply.rawHeader(b"ETag").data().decode() or None
+            status = reply.attribute(QtNetwork.QNetworkRequest.HttpStatusCodeAttribute)
+            if status == 304:
+                # not modified, no need to download and parse the release again
+                if cache := self.read_release_info_cache():
+                    release_info = cache["release_info"]
+                    etag = etag or cache.get("etag")
+                else:
+                    # the cache disappeared in the meantime, nothing to show
+                    release_info = None
+            else:
+                try:
+                    release_info = json.loads(reply.readAll().data())
+                except json.JSONDecodeError:
+                    release_info = None
+            if release_info is not None:
+                self.write_cached_release_info(release_info, etag)
+        self.show_update_info(release_info, silent)
+
+    def read_release_info_cache(self):
+        """Read the cached results of a previous update check.
+
+        Returns:
+            dict: the time the release information was fetched, its ETag and
+                the release information itself, or None if unavailable.
+        """
+        try:
+            with open(self.get_update_check_path(), encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            isinstance(cache, dict)
+            and isinstance(cache.get("fetched_at"), (int, float))
+            and "release_info" in cache
+        ):
+            return cache
+        else:
+            return None
+
+    def is_fresh(self, cache):
+        """Check whether cached release information can be used as is.
+
+        Args:
+            cache (dict): the cached results of a previous update check.
+
+        Returns:
+            bool: True if the release information is recent enough.
+        """
+        return 0 <= time.time() - cache["fetched_at"] < UPDATE_CHECK_TTL
+
+    def write_cached_release_info(self, release_info, etag=None):
+        """Store release information for subsequent update checks.
+
+        Args:
+            release_info (dict): the release information from the GitHub API.
+            etag (str, optional): the ETag of the release information, used to
+                check whether it has changed. Defaults to None.
+        """
+        try:
+            config.create_config_dir()
+            with open(self.get_update_check_path(), "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "fetched_at": time.time(),
+                        "etag": etag,
+                        "release_info": release_info,
+                    },
+                    f,
+                )
+        except OSError:
+            # caching is optional
+            pass
+
+    def get_update_check_path(self):
+        """Get path of the cached release information."""
+        return config.get_config_path().parent / UPDATE_CHECK_FILE
+
+    def show_update_info(self, release_info, silent=False):
+        """Inform the user about available updates.
+
+        Args:
+            release_info (dict): the release information from the GitHub API,
+                or None if it could not be retrieved.
+            silent (bool, optional): If there are no updates available, should
+                this method return silently? Defaults to False.
+        """
+        if release_info is None:
+            latest_version, update_link, release_notes_link = None, None, None
+        else:
+            (
+                latest_version,
+                update_link,
+                release_notes_link,
+            ) = self.get_latest_version_and_update_link(release_info)
         if latest_version is None:
             msg = "You appear to have no internet connection or GitHub is down."
         elif update_link is None:
@@ -1208,76 +1739,60 @@ class MainWindow(QtWidgets.QMainWindow):
             dialog.button(QtWidgets.QMessageBox.Ok).setText("Download Update")
             dialog.button(QtWidgets.QMessageBox.Cancel).setText("Skip Update")
 
-            value = dialog.exec()
-            match value:
-                case QtWidgets.QMessageBox.Ok:
-                    # if app is in the main event loop, ask to quit so user can
-                    # install update
-                    QtWidgets.QApplication.instance().quit()
-                    # after possible 'save your project' dialogs, download update
-                    webbrowser.open(update_link)
-                    # if not, return with True to signal that the user wants the update
-                    return True
-                case QtWidgets.QMessageBox.Cancel:
-                    return False
-                case default:
-                    return None
-
-    def get_latest_version_and_update_link(self):
+            if dialog.exec() == QtWidgets.QMessageBox.Ok:
+                # ask to quit so user can install update
+                QtWidgets.QApplication.instance().quit()
+                # after possible 'save your project' dialogs, download update
+                open_url(update_link)
+
+    def get_latest_version_and_update_link(self, release_info):
         """Get latest version and link to latest release, if available.
 
         Get the latest version of Tailor. If a new release is available, returns
         a platform-specific download link. If there is no new release, returns
         None.
 
+        Args:
+            release_info (dict): the release information from the GitHub API.
+
         Returns:
             str: URL to download link or None.
         """
-        try:
-            r = urllib.request.urlopen(RELEASE_API_URL, timeout=HTTP_TIMEOUT)
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError):
-            # no internet connection?
-            return None, None, None
-        else:
-            release_info = json.loads(r.read())
-            latest_version = release_info["name"]
-            if packaging.version.parse(latest_version) > packaging.version.parse(
-                __version__
-            ):
-                asset_urls = [a["browser_download_url"] for a in release_info["assets"]]
-                system, machine = platform.system(), platform.machine()
-                try:
-                    match system, machine:
-                        case ("Darwin", "arm64"):
-                            download_url = next(
-                                (u for u in asset_urls if "apple_silicon.dmg" in u),
-                                None,
-                            ) or next(u for u in asset_urls if ".dmg" in u)
-                        case ("Darwin", "x86_64"):
-                            download_url = next(
-                                (u for u in asset_urls if "intel.dmg" in u), None
-                            ) or next(u for u in asset_urls if ".dmg" in u)
-                        case ("Windows", *machine):
-                            download_url = next(u for u in asset_urls if ".msi" in u)
-                        case default:
-                            # platform not yet supported
-                            download_url = None
-                except StopIteration:
-                    # the iterator in the next()-statement was empty, so no updates available
-                    download_url = None
-            else:
-                # No new version available
+        latest_version = release_info["name"]
+        if packaging.version.parse(latest_version) > CURRENT_VERSION:
+            system, machine = platform.system(), platform.machine()
+            patterns = ASSET_PATTERNS.get((system, machine)) or ASSET_PATTERNS.get(
+                (system, None)
+            )
+            if patterns is None:
+                # platform not yet supported
                 download_url = None
-            return latest_version, download_url, release_info["html_url"]
+            else:
+                # find the first download link for each pattern in a single pass
+                urls_by_pattern = {}
+                for asset in release_info["assets"]:
+                    url = asset["browser_download_url"]
+                    for pattern in patterns:
+                        if pattern in url:
+                            urls_by_pattern.setdefault(pattern, url)
+                # if no pattern matches, no updates are available
+                download_url = next(
+                    (urls_by_pattern[p] for p in patterns if p in urls_by_pattern),
+                    None,
+                )
+        else:
+            # No new version available
+            download_url = None
+        return latest_version, download_url, release_info["html_url"]
 
     def report_issue(self) -> None:
-        webbrowser.open("https://github.com/davidfokkema/tailor/issues")
+        open_url("https://github.com/davidfokkema/tailor/issues")
 
     def show_documentation(self) -> None:
-        webbrowser.open("https://davidfokkema.github.io/tailor/")
+        open_url("https://davidfokkema.github.io/tailor/")
 
     def show_code_repository(self) -> None:
-        webbrowser.open("https://github.com/davidfokkema/tailor")
+        open_url("https://github.com/davidfokkema/tailor")
 
 
 class Application(QtWidgets.QApplication):
@@ -1290,10 +1805,9 @@ class Application(QtWidgets.QApplication):
         self.app.show()
         # Preflight
         if update_check:
-            # will check for updates
-            if self.app.check_for_updates(silent=True):
-                # user wants to install available updates, so quit
-                return
+            # check for updates in the background; if the user wants to install
+            # an available update, the app will quit
+            self.app.check_for_updates(silent=True)
         if project_path and pathlib.Path(project_path).is_file():
             self.app.open_project_dialog(filename=project_path)
 
@@ -1,4 +1,6 @@
+import functools
 import importlib.metadata
+import os
 import pathlib
 import tomllib
 
@@ -12,7 +14,19 @@ CONFIG_FILE = "config.toml"
 
 def read_config():
     """Read configuration file."""
-    config_path = get_config_path()
+    return load_config_file(get_config_path())
+
+
+def load_config_file(config_path):
+    """Load configuration from a file.
+
+    Args:
+        config_path: the path of the configuration file.
+
+    Returns:
+        dict: the configuration, or an empty dictionary if the file does not
+            exist or can't be parsed.
+    """
     if config_path.is_file():
         try:
             with open(config_path, "rb") as f:
@@ -32,17 +46,42 @@ def write_config(config):
     """
     create_config_dir()
     config_path = get_config_path()
-    # make sure that TOML conversion works before opening file
-    tomli_w.dumps(config)
-    with open(config_path, "wb") as f:
-        # separate TOML generation from writing to file, or an exception
-        # generating TOML will result in an empty file
-        # correct TOML unicode handling requires writing bytes
-        tomli_w.dump(config, f)
+    # generate TOML before opening any file, or an exception generating TOML
+    # will result in an empty file
+    # correct TOML unicode handling requires writing bytes
+    contents = tomli_w.dumps(config).encode("utf-8")
+    # write to a temporary file first and replace the configuration file in one
+    # go, so that it is never left half-written
+    tmp_path = config_path.with_suffix(".toml.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(contents)
+    os.replace(tmp_path, config_path)
+
 
+def update_config(**kwargs):
+    """Update configuration file.
 
+    Reads and updates the configuration and writes it in one go, so that the
+    file is never left truncated or half-written.
+
+    Args:
+        kwargs: configuration keys and their new values.
+
+    Returns:
+        dict: the updated configuration.
+    """
+    config = load_config_file(get_config_path())
+    config.update(kwargs)
+    write_config(config)
+    return config
+
+
+@functools.cache
 def get_config_path():
-    """Get path of configuration file."""
+    """Get path of configuration file.
+
+    The path doesn't change while running, so it is only determined once.
+    """
     config_dir = pathlib.Path(appdirs.user_config_dir(APP_NAME))
     config_path = config_dir / CONFIG_FILE
     return config_path
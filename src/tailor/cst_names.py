@@ -1,28 +1,85 @@
-import libcst as cst
+import ast
+import functools
+import io
+import keyword
+import tokenize
 
+# number of tokenized expressions to remember
+EXPRESSION_CACHE_SIZE = 1024
 
-class FindVariables(cst.CSTVisitor):
-    def __init__(self) -> None:
-        super().__init__()
-        self.names = set()
 
-    def visit_Name(self, node: cst.Name) -> None:
-        self.names.add(node.value)
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def tokenize_expression(
+    expression: str,
+) -> tuple[tuple[str, ...], tuple[tokenize.TokenInfo, ...]]:
+    """Validate and tokenize an expression.
 
+    Expressions are usually both analysed and renamed, often repeatedly, so the
+    result is cached.
 
-class RenameVariables(cst.CSTTransformer):
-    def __init__(self, mapping: dict[str, str]):
-        super().__init__()
-        self.mapping = mapping
+    Args:
+        expression (str): the expression.
 
-    def leave_Name(self, node: cst.Name, updated_node: cst.Name) -> cst.Name:
-        if node.value in self.mapping.keys():
-            return updated_node.with_changes(value=self.mapping[node.value])
-        else:
-            return updated_node
+    Raises:
+        SyntaxError: the expression is not valid.
+
+    Returns:
+        tuple: the lines of the expression and its tokens.
+    """
+    try:
+        # first parse as expression to see if it is valid code, using the much
+        # faster built-in parser since the tree is not needed
+        ast.parse(expression, mode="eval")
+    except SyntaxError:
+        raise SyntaxError("SyntaxError while parsing expression")
+
+    lines = tuple(io.StringIO(expression).readlines())
+    tokens = tuple(tokenize.generate_tokens(iter(lines).__next__))
+    return lines, tokens
+
+
+def is_name_token(token: tokenize.TokenInfo) -> bool:
+    return token.type == tokenize.NAME and not keyword.iskeyword(token.string)
+
+
+def has_string_tokens(tokens: tuple[tokenize.TokenInfo, ...]) -> bool:
+    # names inside f-strings are not separate tokens in all Python versions
+    return any(token.type == tokenize.STRING for token in tokens)
 
 
 def rename_variables(expression: str, mapping: dict[str, str]) -> str:
+    lines, tokens = tokenize_expression(expression)
+    if has_string_tokens(tokens):
+        return rename_variables_with_cst(expression, mapping)
+
+    # replace names in the original text, preserving whitespace etc.
+    line_offsets = [0]
+    for line in lines:
+        line_offsets.append(line_offsets[-1] + len(line))
+    parts = []
+    offset = 0
+    for token in tokens:
+        if token.string in mapping and is_name_token(token):
+            (start_row, start_col), (end_row, end_col) = token.start, token.end
+            start = line_offsets[start_row - 1] + start_col
+            parts.append(expression[offset:start])
+            parts.append(mapping[token.string])
+            offset = line_offsets[end_row - 1] + end_col
+    parts.append(expression[offset:])
+    return "".join(parts)
+
+
+def rename_variables_with_cst(expression: str, mapping: dict[str, str]) -> str:
+    # libcst takes a while to import and is rarely needed
+    import libcst as cst
+
+    class RenameVariables(cst.CSTTransformer):
+        def leave_Name(self, node: cst.Name, updated_node: cst.Name) -> cst.Name:
+            if node.value in mapping.keys():
+                return updated_node.with_changes(value=mapping[node.value])
+            else:
+                return updated_node
+
     try:
         # first parse as expression to see if it is valid code
         cst.parse_expression(expression)
@@ -31,12 +88,30 @@ def rename_variables(expression: str, mapping: dict[str, str]) -> str:
     except cst.ParserSyntaxError:
         raise SyntaxError("SyntaxError while parsing expression")
 
-    transformer = RenameVariables(mapping)
+    transformer = RenameVariables()
     modified_tree = tree.visit(transformer)
     return modified_tree.code
 
 
-def get_variable_names(expression: str) -> list[str]:
+def get_variable_names(expression: str) -> set[str]:
+    _, tokens = tokenize_expression(expression)
+    if has_string_tokens(tokens):
+        return get_variable_names_with_cst(expression)
+    return {token.string for token in tokens if is_name_token(token)}
+
+
+def get_variable_names_with_cst(expression: str) -> set[str]:
+    # libcst takes a while to import and is rarely needed
+    import libcst as cst
+
+    class FindVariables(cst.CSTVisitor):
+        def __init__(self) -> None:
+            super().__init__()
+            self.names = set()
+
+        def visit_Name(self, node: cst.Name) -> None:
+            self.names.add(node.value)
+
     try:
         tree = cst.parse_expression(expression)
     except cst.ParserSyntaxError:
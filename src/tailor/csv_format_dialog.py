@@ -1,9 +1,11 @@
 import collections
+import itertools
 import textwrap
 from pathlib import Path
+from typing import Callable
 
 import pandas as pd
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 
 from tailor.ui_csv_format_dialog import Ui_CsvFormatDialog
 
@@ -15,6 +17,15 @@ DELIMITER_CHOICES = {
     "space": " ",
 }
 NUM_FORMAT_CHOICES = {"1,000.0": (".", ","), "1.000,0": (",", ".")}
+# number of data rows to parse for the preview
+PREVIEW_ROWS = 200
+# number of lines to show in the plain text preview
+PREVIEW_LINES = 500
+# number of data rows to parse at a time when importing all data
+IMPORT_CHUNK_ROWS = 100_000
+# delay in ms before updating the preview, so that quick successive changes to
+# the format (e.g. typing a row number) only parse the file once
+PREVIEW_DELAY = 150
 
 FormatParameters = collections.namedtuple(
     "FormatParameters",
@@ -23,7 +34,53 @@ FormatParameters = collections.namedtuple(
 )
 
 
+def read_csv(
+    path: Path | str,
+    format: FormatParameters,
+    nrows: int | None = None,
+    chunksize: int | None = None,
+    progress: Callable[[], None] | None = None,
+) -> pd.DataFrame:
+    """Read CSV data into pandas DataFrame.
+
+    Args:
+        path (Path | str): path to the CSV file.
+        format (FormatParameters): CSV format parameters.
+        nrows (int | None): the maximum number of data rows to read, or None
+            to read all rows.
+        chunksize (int | None): if not None, parse the file this many rows at
+            a time.
+        progress (Callable | None): if not None, called after each chunk has
+            been parsed.
+
+    Returns:
+        pd.DataFrame: the new data frame.
+    """
+    kwargs = dict(
+        delimiter=format.delimiter,
+        decimal=format.decimal,
+        thousands=format.thousands,
+        header=format.header,
+        skiprows=format.skiprows,
+        nrows=nrows,
+        encoding_errors="backslashreplace",
+    )
+    if chunksize is None:
+        return pd.read_csv(path, **kwargs)
+
+    chunks = []
+    with pd.read_csv(path, chunksize=chunksize, **kwargs) as reader:
+        for chunk in reader:
+            chunks.append(chunk)
+            if progress is not None:
+                progress()
+    return pd.concat(chunks, ignore_index=True)
+
+
 class CSVFormatDialog(QtWidgets.QDialog):
+    _preview_df: pd.DataFrame | None = None
+    _preview_format: FormatParameters | None = None
+
     def __init__(self, filename, parent):
         """Create the CSV file format selection dialog."""
         super().__init__()
@@ -32,32 +89,39 @@ class CSVFormatDialog(QtWidgets.QDialog):
         self.ui.setupUi(self)
 
         self.filename = Path(filename).expanduser()
+        # the preview is read-only and replaced as a whole, so don't keep an
+        # undo history of all previews
+        self.ui.preview_box.setUndoRedoEnabled(False)
 
         self.ui.delimiter_box.addItems(DELIMITER_CHOICES.keys())
         self.ui.num_format_box.addItems(NUM_FORMAT_CHOICES.keys())
 
-        self.ui.delimiter_box.currentIndexChanged.connect(self.show_preview)
-        self.ui.num_format_box.currentIndexChanged.connect(self.show_preview)
-        self.ui.use_header_box.stateChanged.connect(self.show_preview)
-        self.ui.header_row_box.valueChanged.connect(self.show_preview)
-        self.ui.preview_choice.buttonClicked.connect(self.show_preview)
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DELAY)
+        self._preview_timer.timeout.connect(self.show_preview)
+
+        self.ui.delimiter_box.currentIndexChanged.connect(self.schedule_preview)
+        self.ui.num_format_box.currentIndexChanged.connect(self.schedule_preview)
+        self.ui.use_header_box.stateChanged.connect(self.schedule_preview)
+        self.ui.header_row_box.valueChanged.connect(self.schedule_preview)
+        self.ui.preview_choice.buttonClicked.connect(self.schedule_preview)
 
         self.show_preview()
 
+    def schedule_preview(self):
+        """Show a preview of the CSV data after a short delay.
+
+        The preview is only updated once if the format changes multiple times
+        within the delay.
+        """
+        self._preview_timer.start()
+
     def show_preview(self):
         """Show a preview of the CSV data."""
         if self.ui.preview_choice.checkedButton() == self.ui.preview_csv_button:
-            format = self.get_format_parameters()
             try:
-                df = pd.read_csv(
-                    self.filename,
-                    delimiter=format.delimiter,
-                    decimal=format.decimal,
-                    thousands=format.thousands,
-                    header=format.header,
-                    skiprows=format.skiprows,
-                    encoding_errors="backslashreplace",
-                )
+                df = self.get_preview_dataframe()
             except pd.errors.ParserError as exc:
                 text = textwrap.dedent(
                     f"""\
@@ -79,8 +143,10 @@ class CSVFormatDialog(QtWidgets.QDialog):
                 text = df.to_string()
         else:
             try:
-                with open(self.filename) as f:
-                    text = "".join(f.readlines())
+                with open(self.filename, errors="backslashreplace") as f:
+                    text = "".join(itertools.islice(f, PREVIEW_LINES))
+                    if f.readline():
+                        text += "\n... (truncated) ...\n"
             except Exception as exc:
                 text = textwrap.dedent(
                     f"""\
@@ -96,6 +162,58 @@ class CSVFormatDialog(QtWidgets.QDialog):
                 )
         self.ui.preview_box.setPlainText(text)
 
+    def get_preview_dataframe(self) -> pd.DataFrame:
+        """Get the first rows of the CSV data for the preview.
+
+        Only the first PREVIEW_ROWS rows are parsed, using the selected format
+        parameters. The data file is only parsed again if the format parameters
+        changed since the last preview.
+
+        Returns:
+            pd.DataFrame: the first rows of the CSV data.
+        """
+        format = self.get_format_parameters()
+        if self._preview_df is None or format != self._preview_format:
+            # forget data parsed with other parameters, even if parsing fails
+            self._preview_df = None
+            self._preview_df = read_csv(self.filename, format, nrows=PREVIEW_ROWS)
+            self._preview_format = format
+        return self._preview_df
+
+    def is_preview_complete(self) -> bool:
+        """Check whether the preview contains all rows of the data file.
+
+        Returns:
+            bool: True if the preview data was parsed using the current format
+                parameters and contains all rows.
+        """
+        return (
+            self._preview_df is not None
+            and self.get_format_parameters() == self._preview_format
+            and len(self._preview_df) < PREVIEW_ROWS
+        )
+
+    def get_dataframe(self) -> pd.DataFrame:
+        """Get all CSV data, parsed using the selected format parameters.
+
+        If the preview already contains all rows of the data file, the preview
+        data is reused instead of parsing the file again. Otherwise, the file is
+        parsed in chunks of IMPORT_CHUNK_ROWS rows, processing pending GUI events
+        in between.
+
+        Returns:
+            pd.DataFrame: the CSV data.
+        """
+        if self.is_preview_complete():
+            return self._preview_df
+        return read_csv(
+            self.filename,
+            self.get_format_parameters(),
+            chunksize=IMPORT_CHUNK_ROWS,
+            # keep the user interface responsive
+            progress=QtWidgets.QApplication.processEvents,
+        )
+
     def get_format_parameters(self):
         """Get CSV format parameters
 
@@ -4,6 +4,8 @@ Implements a model to contain the data values as a backend for the
 table view used in the app. This class provides an API specific to Tailor.
 """
 
+import ast
+import functools
 import pathlib
 import re
 
@@ -11,8 +13,34 @@ import asteval
 import numpy as np
 import pandas as pd
 
-from tailor.cst_names import get_variable_names, rename_variables
-from tailor.csv_format_dialog import FormatParameters
+from tailor.cst_names import (
+    EXPRESSION_CACHE_SIZE,
+    get_variable_names,
+    rename_variables,
+)
+from tailor.csv_format_dialog import FormatParameters, read_csv
+
+# non-word characters and the start of names starting with a digit
+INVALID_NAME_CHARS = re.compile(r"\W|^(?=\d)")
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def parse_expression(expression: str) -> ast.Module:
+    """Parse an expression for evaluation by asteval.
+
+    The result is cached, so columns are not parsed again when recalculating
+    values after each edit.
+
+    Args:
+        expression (str): the mathematical expression.
+
+    Raises:
+        SyntaxError: the expression is not valid Python.
+
+    Returns:
+        ast.Module: the parsed expression.
+    """
+    return ast.parse(expression)
 
 
 class DataModel:
@@ -28,12 +56,26 @@ class DataModel:
     _col_names: dict[str, str]
     _calculated_column_expression: dict[str, str]
     _is_calculated_column_valid: dict[str, bool]
+    # column index -> column values, only valid for the cached data frame
+    _column_arrays: dict[int, np.ndarray]
+    # column index -> calculated / valid, only valid for the cached data frame
+    _calculated_mask: np.ndarray | None = None
+    _valid_mask: np.ndarray | None = None
+    # column labels in order, only valid for the cached data frame
+    _column_labels: tuple[str, ...] | None = None
+    # column labels -> column index, only valid for the cached data frame
+    _column_indexes: dict[str, int] | None = None
+    _cached_data: pd.DataFrame | None = None
+    # shared interpreter for calculated columns and its initial symbol table
+    _interpreter: asteval.Interpreter | None = None
+    _base_symtable: dict
 
     def __init__(self) -> None:
         self._data = pd.DataFrame()
         self._col_names = {}
         self._calculated_column_expression = {}
         self._is_calculated_column_valid = {}
+        self._column_arrays = {}
 
     def num_rows(self):
         """Return the number of rows in the table."""
@@ -50,7 +92,63 @@ class DataModel:
             row (int): row number
             column (int): column number
         """
-        return self._data.iat[row, column]
+        return self._get_column_array(column)[row]
+
+    def _get_column_array(self, column: int) -> np.ndarray:
+        """Get the values of a column as a (cached) NumPy array.
+
+        The table view requests values cell by cell, and indexing the data
+        frame for every single cell is slow. The column values are cached until
+        the data is modified or replaced.
+
+        Args:
+            column (int): column number
+
+        Returns:
+            np.ndarray: the column values.
+        """
+        self._check_cached_data()
+        if (values := self._column_arrays.get(column)) is None:
+            values = self._data.iloc[:, column].to_numpy()
+            self._column_arrays[column] = values
+        return values
+
+    def _check_cached_data(self) -> None:
+        """Clear the caches if the data frame was replaced."""
+        if self._cached_data is not self._data:
+            # e.g. after inserting rows or loading a project
+            self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Clear the cached column values and properties.
+
+        Must be called after modifying the data frame in place or changing which
+        columns are calculated.
+        """
+        self._column_arrays.clear()
+        self._calculated_mask = None
+        self._valid_mask = None
+        self._column_labels = None
+        self._column_indexes = None
+        self._cached_data = self._data
+
+    def _build_column_masks(self) -> None:
+        """Build the (cached) calculated and valid masks for all columns."""
+        self._check_cached_data()
+        if self._calculated_mask is None:
+            labels = self._data.columns
+            self._calculated_mask = np.array(
+                [self.is_calculated_column(label) for label in labels], dtype=bool
+            )
+            # calculated columns which were not yet calculated are not valid,
+            # e.g. while loading a project
+            self._valid_mask = ~self._calculated_mask | np.array(
+                [
+                    self._is_calculated_column_valid.get(label, False)
+                    for label in labels
+                ],
+                dtype=bool,
+            )
 
     def get_values(
         self, start_row: int, start_column: int, end_row: int, end_column: int
@@ -67,8 +165,9 @@ class DataModel:
             value (float): value to insert
         """
         self._data.iat[row, column] = value
+        self._invalidate_caches()
         label = self.get_column_label(column)
-        self.recalculate_columns_from(label)
+        self.recalculate_columns_using([label])
 
     def set_values(
         self,
@@ -94,8 +193,9 @@ class DataModel:
             value (float): the value to set all cells to.
         """
         self._data.iloc[start_row : end_row + 1, start_column : end_column + 1] = value
-        label = self.get_column_label(start_column)
-        self.recalculate_columns_from(label)
+        self._invalidate_caches()
+        labels = self._data.columns[start_column : end_column + 1]
+        self.recalculate_columns_using(list(labels))
 
     def set_values_from_array(
         self,
@@ -120,8 +220,9 @@ class DataModel:
         self._data.iloc[
             start_row : start_row + height, start_column : start_column + width
         ] = values
-        label = self.get_column_label(start_column)
-        self.recalculate_columns_from(label)
+        self._invalidate_caches()
+        labels = self._data.columns[start_column : start_column + width]
+        self.recalculate_columns_using(list(labels))
 
     def insert_rows(self, row: int, count: int):
         """Insert rows into the table.
@@ -132,14 +233,25 @@ class DataModel:
             row (int): an integer row number to indicate the place of insertion.
             count (int): number of rows to insert
         """
-        new_data = pd.DataFrame.from_dict(
-            {col: count * [np.nan] for col in self._data.columns}
+        # build each column in one go, instead of concatenating data frames
+        new_values = np.full(count, np.nan)
+        self._data = pd.DataFrame(
+            {
+                label: np.concatenate([values[:row], new_values, values[row:]])
+                for label, values in self._iter_column_arrays()
+            }
         )
-        self._data = pd.concat(
-            [self._data.iloc[:row], new_data, self._data.iloc[row:]]
-        ).reset_index(drop=True)
         self.recalculate_all_columns()
 
+    def _iter_column_arrays(self):
+        """Iterate over all column labels and values.
+
+        Yields:
+            tuple[str, np.ndarray]: the column label and its values.
+        """
+        for label, values in self._data.items():
+            yield label, values.to_numpy()
+
     def remove_rows(self, row: int, count: int):
         """Remove rows from the table.
 
@@ -149,8 +261,10 @@ class DataModel:
             row (int): the first row to remove.
             count (int): the number of rows to remove.
         """
-        self._data = self._data.drop(index=range(row, row + count)).reset_index(
-            drop=True
+        keep = np.ones(self.num_rows(), dtype=bool)
+        keep[row : row + count] = False
+        self._data = pd.DataFrame(
+            {label: values[keep] for label, values in self._iter_column_arrays()}
         )
 
     def insert_columns(self, column: int, count: int):
@@ -169,6 +283,7 @@ class DataModel:
         for idx, label in zip(range(column, column + count), labels):
             self._data.insert(idx, label, np.nan)
             self._col_names[label] = label
+        self._invalidate_caches()
         return labels
 
     def remove_columns(self, column: int, count: int):
@@ -182,6 +297,7 @@ class DataModel:
         """
         labels = self._data.columns[column : column + count]
         self._data.drop(columns=labels, inplace=True)
+        self._invalidate_caches()
         for label in labels:
             if self.is_calculated_column(label):
                 del self._calculated_column_expression[label]
@@ -245,6 +361,7 @@ class DataModel:
         (label,) = self.insert_columns(column, count=1)
         self._calculated_column_expression[label] = ""
         self._is_calculated_column_valid[label] = False
+        self._invalidate_caches()
         return label
 
     def rename_column(self, label: str, name: str):
@@ -270,7 +387,7 @@ class DataModel:
         Returns:
             str: the normalized name.
         """
-        return re.sub(r"\W|^(?=\d)", "_", name)
+        return INVALID_NAME_CHARS.sub("_", name)
 
     def get_column_expression(self, label: str):
         """Get column expression.
@@ -339,11 +456,34 @@ class DataModel:
         Args:
             label (str): the column label to start from.
         """
-        idx = self._data.columns.get_loc(label)
+        idx = self._get_column_index(label)
         for column in self._data.columns[idx:]:
             if self.is_calculated_column(column):
                 self.recalculate_column(column)
 
+    def recalculate_columns_using(self, labels: list[str]):
+        """Recalculate all columns depending on the given columns.
+
+        When updating values, only the calculated columns which use the updated
+        columns, directly or through other calculated columns, must be updated.
+        Since columns can only use columns to their left, a single pass from left
+        to right suffices. Updated columns which are calculated themselves are
+        recalculated as well.
+
+        Args:
+            labels (list[str]): the labels of the updated columns.
+        """
+        # expressions may still contain a name instead of a label, see
+        # get_column_expression()
+        changed = set(labels) | {self.get_column_name(label) for label in labels}
+        idx = min(self._get_column_index(label) for label in labels)
+        for column in self._data.columns[idx:]:
+            if self.is_calculated_column(column) and (
+                column in changed or self.column_uses(column, changed)
+            ):
+                self.recalculate_column(column)
+                changed |= {column, self.get_column_name(column)}
+
     def recalculate_all_columns(self):
         """Recalculate all columns.
 
@@ -371,10 +511,11 @@ class DataModel:
         expression = self.get_column_expression(label)
         # set up interpreter
         objects = self._get_accessible_columns(label)
-        aeval = asteval.Interpreter(usersyms=objects)
+        aeval = self._get_interpreter(objects)
         try:
             # try to evaluate expression and cast output to a float (series)
-            output = aeval(expression, show_errors=False, raise_errors=True)
+            node = parse_expression(expression)
+            output = aeval.eval(node, show_errors=False, raise_errors=True)
             if isinstance(output, pd.Series) or isinstance(output, np.ndarray):
                 output = output.astype("float64")
             else:
@@ -382,13 +523,51 @@ class DataModel:
         except Exception as exc:
             # error in evaluation or output cannot be cast to a float (series)
             self._is_calculated_column_valid[label] = False
+            self._update_column_caches(label, is_valid=False)
             return False
         else:
             # evaluation was successful
             self._data[label] = output
             self._is_calculated_column_valid[label] = True
+            self._update_column_caches(label, is_valid=True)
             return True
 
+    def _update_column_caches(self, label: str, is_valid: bool) -> None:
+        """Update the caches after recalculating a single column.
+
+        Other columns are unaffected, so there is no need to clear all caches
+        when recalculating many columns in a row.
+
+        Args:
+            label (str): the column label.
+            is_valid (bool): whether the column values are valid.
+        """
+        self._check_cached_data()
+        column = self._get_column_index(label)
+        self._column_arrays.pop(column, None)
+        if self._valid_mask is not None:
+            self._valid_mask[column] = is_valid
+
+    def _get_interpreter(self, objects: dict[str, pd.Series]) -> asteval.Interpreter:
+        """Get the interpreter to evaluate column expressions.
+
+        Creating an interpreter is relatively expensive, so a single one is
+        reused. Its symbol table is reset for each evaluation so that only the
+        given objects are accessible and no symbols are left over from previous
+        evaluations.
+
+        Args:
+            objects (dict[str, pd.Series]): the accessible column data.
+
+        Returns:
+            asteval.Interpreter: the interpreter.
+        """
+        if self._interpreter is None:
+            self._interpreter = asteval.Interpreter()
+            self._base_symtable = dict(self._interpreter.symtable)
+        self._interpreter.symtable = self._base_symtable | objects
+        return self._interpreter
+
     def _get_accessible_columns(self, label: str) -> dict[str, pd.Series]:
         """Get accessible column data for use in expressions.
 
@@ -404,14 +583,11 @@ class DataModel:
         Returns:
             dict: a dictionary of column label, data value pairs.
         """
-        # accessible columns to the left of current column
-        idx = self._data.columns.get_loc(label)
-        accessible_columns = self._data.columns[:idx]
-        return {
-            self.get_column_name(k): self._data[k]
-            for k in accessible_columns
-            if self.is_column_valid(k)
-        }
+        # accessible (valid) columns to the left of current column
+        idx = self._get_column_index(label)
+        self._build_column_masks()
+        accessible_columns = self._data.columns[:idx][self._valid_mask[:idx]]
+        return {self._col_names[k]: self._data[k] for k in accessible_columns}
 
     def get_column_label(self, column: int) -> str:
         """Get column label.
@@ -424,7 +600,30 @@ class DataModel:
         Returns:
             The column label as a string.
         """
-        return self._data.columns[column]
+        # the table view asks for every column header on each repaint
+        self._check_cached_data()
+        if self._column_labels is None:
+            self._column_labels = tuple(self._data.columns)
+        return self._column_labels[column]
+
+    def _get_column_index(self, label: str) -> int:
+        """Get the index of a column.
+
+        Looking up the label in a (cached) dictionary is much faster than
+        looking it up in the pandas column index.
+
+        Args:
+            label (str): the column label.
+
+        Returns:
+            int: the column index.
+        """
+        self._check_cached_data()
+        if self._column_indexes is None:
+            self._column_indexes = {
+                label: idx for idx, label in enumerate(self._data.columns)
+            }
+        return self._column_indexes[label]
 
     def get_column_label_by_name(self, name: str) -> str:
         """Get column label by name.
@@ -501,6 +700,21 @@ class DataModel:
         """
         return label in self._calculated_column_expression
 
+    def is_calculated_column_at(self, column: int) -> bool:
+        """Check if the column at the given index is calculated.
+
+        Equivalent to `is_calculated_column(get_column_label(column))`, but
+        faster, since the table view calls this for every cell.
+
+        Args:
+            column (int): column number
+
+        Returns:
+            True if the column is calculated, False otherwise.
+        """
+        self._build_column_masks()
+        return bool(self._calculated_mask[column])
+
     def is_column_valid(self, label: str):
         """Check if a column has valid values.
 
@@ -521,6 +735,21 @@ class DataModel:
         else:
             return self._is_calculated_column_valid[label]
 
+    def is_column_valid_at(self, column: int) -> bool:
+        """Check if the column at the given index has valid values.
+
+        Equivalent to `is_column_valid(get_column_label(column))`, but faster,
+        since the table view calls this for every cell.
+
+        Args:
+            column (int): column number
+
+        Returns:
+            True if the column values are valid, False otherwise.
+        """
+        self._build_column_masks()
+        return bool(self._valid_mask[column])
+
     def column_uses(self, label: str, labels: list[str]) -> bool:
         """Test whether column uses any of the listed columns.
 
@@ -529,7 +758,7 @@ class DataModel:
 
         Args:
             label (str): the column under test.
-            labels (list[str]): the column labels to test.
+            labels (Iterable[str]): the column labels to test.
 
         Returns:
             bool: True if any of the column labels are used.
@@ -541,10 +770,7 @@ class DataModel:
             variables = get_variable_names(expression)
         except SyntaxError:
             variables = set()
-        if variables & set(labels):
-            return True
-        else:
-            return False
+        return not variables.isdisjoint(labels)
 
     def _create_new_column_label(self):
         """Create a label for a new column.
@@ -578,7 +804,18 @@ class DataModel:
             filename (pathlib.Path | str): a string containing the path to the CSV file
             format (FormatParameters): CSV format parameters
         """
-        df = self.create_df_from_csv(filename, format)
+        self.import_dataframe(read_csv(filename, format))
+
+    def import_dataframe(self, df: pd.DataFrame):
+        """Import data from a pandas DataFrame.
+
+        Overwrites all existing data by importing the data frame, e.g. CSV data
+        which was already read for a preview.
+
+        Args:
+            df (pd.DataFrame): the data to import. It is not modified.
+        """
+        df = self.normalize_columns(df)
 
         self._new_col_num = 0
         col_names = list(df.columns)
@@ -605,7 +842,18 @@ class DataModel:
             filename (pathlib.Path | str): a string containing the path to the CSV file
             format (FormatParameters): CSV format parameters
         """
-        df = self.create_df_from_csv(filename, format)
+        self.merge_dataframe(read_csv(filename, format))
+
+    def merge_dataframe(self, df: pd.DataFrame):
+        """Merge data from a pandas DataFrame into existing data sheet.
+
+        Overwrites all existing columns by importing the data frame, but keeps
+        other columns.
+
+        Args:
+            df (pd.DataFrame): the data to merge. It is not modified.
+        """
+        df = self.normalize_columns(df)
 
         # prepare data for merge operation
         existing_col_names = self.get_column_names()
@@ -620,20 +868,23 @@ class DataModel:
             if self.is_calculated_column(label):
                 self._calculated_column_expression.pop(label)
                 self._is_calculated_column_valid.pop(label)
+                self._invalidate_caches()
         # rename columns to use labels instead of names
         import_data = df.rename(
             columns={name: label for label, name in self._col_names.items()}
         )
 
-        # drop imported columns from existing data, ignore missing columns
-        old_data = self._data.drop(import_data.columns, axis="columns", errors="ignore")
-        # concatenate imported and old data
-        new_data = pd.concat([import_data, old_data], axis="columns")
-        # drop excess rows, if imported data is shorter than old data
-        final_data = new_data.truncate(0, len(import_data) - 1)
+        # imported columns first, followed by the remaining existing columns
+        # which are truncated or padded to the length of the imported data
+        num_rows = len(import_data)
+        columns = {label: values.to_numpy() for label, values in import_data.items()}
+        for label, values in self._iter_column_arrays():
+            if label not in columns:
+                padding = np.full(max(num_rows - len(values), 0), np.nan)
+                columns[label] = np.concatenate([values[:num_rows], padding])
 
         # save final data and recalculate values in calculated columns
-        self._data = final_data
+        self._data = pd.DataFrame(columns)
         self.recalculate_all_columns()
 
     def create_df_from_csv(
@@ -648,17 +899,20 @@ class DataModel:
         Returns:
             pd.DataFrame: the new data frame.
         """
-        df = pd.read_csv(
-            path,
-            delimiter=format.delimiter,
-            decimal=format.decimal,
-            thousands=format.thousands,
-            header=format.header,
-            skiprows=format.skiprows,
-            encoding_errors="backslashreplace",
-        )
+        return self.normalize_columns(read_csv(path, format))
+
+    def normalize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Normalize column names of a data frame.
+
+        Args:
+            df (pd.DataFrame): the data frame.
+
+        Returns:
+            pd.DataFrame: a data frame with valid python variable names as
+                column names.
+        """
         # make sure column names are strings, even for numbered columns
-        df.columns = df.columns.astype(str)
+        columns = df.columns.astype(str)
         # normalize column names to valid python variable names
-        df.columns = df.columns.map(self.normalize_column_name)
-        return df
+        columns = columns.str.replace(INVALID_NAME_CHARS, "_", regex=True)
+        return df.set_axis(columns, axis="columns")
@@ -110,17 +110,16 @@ class PlotModel:
 
         Args:
             model (DataModel): the data model containing the columns under test
-            labels (list[str]): the column labels to check
+            labels (Iterable[str]): the column labels to check
 
         Returns:
             bool: True if any of the columns are in use.
         """
         if model is not self.data_model:
             return False
-        if set(labels) & {self.x_col, self.y_col, self.x_err_col, self.y_err_col}:
-            return True
-        else:
-            return False
+        # no need to copy labels into a set; isdisjoint() accepts any iterable
+        used = {self.x_col, self.y_col, self.x_err_col, self.y_err_col}
+        return not used.isdisjoint(labels)
 
     def get_fit_domain(self) -> tuple[float, float]:
         """Get fit domain.
@@ -1,6 +1,7 @@
 import gzip
 import importlib.metadata
 import json
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -30,13 +31,47 @@ VERSION = metadata["version"]
 
 
 def save_project_to_path(project: "MainWindow", path: Path) -> None:
-    with gzip.open(path, mode="wt", encoding="utf-8") as f:
-        f.write(save_project_to_json(project))
+    save_model_to_path(save_project_to_model(project), path)
+
+
+def save_model_to_path(model: Project, path: Path) -> None:
+    """Serialize a project model and write it to a project file.
+
+    This does not touch any widgets, so it is safe to call from a worker thread.
+
+    Args:
+        model: the project model.
+        path: the path of the project file.
+    """
+    path = Path(path)
+    contents = json.dumps(model.model_dump(), indent=4)
+    # write to a temporary file first, so an interrupted save never leaves a
+    # truncated project file behind
+    tmp_path = path.with_name(path.name + ".tmp")
+    with gzip.open(tmp_path, mode="wt", encoding="utf-8") as f:
+        f.write(contents)
+    os.replace(tmp_path, path)
 
 
 def load_project_from_path(project: "MainWindow", path: Path) -> None:
+    model = read_model_from_path(path)
+    if model is not None:
+        load_project_from_model(project, model)
+
+
+def read_model_from_path(path: Path) -> Project | None:
+    """Read a project file and parse it into a project model.
+
+    This does not touch any widgets, so it is safe to call from a worker thread.
+
+    Args:
+        path: the path of the project file.
+
+    Returns:
+        The project model, or None if the file was not created by Tailor.
+    """
     with gzip.open(path, mode="rt", encoding="utf-8") as f:
-        load_project_from_json(project, f.read())
+        return read_model_from_json(f.read())
 
 
 def save_project_to_json(project: "MainWindow") -> str:
@@ -45,14 +80,20 @@ def save_project_to_json(project: "MainWindow") -> str:
 
 
 def load_project_from_json(project: "MainWindow", jsondata: str) -> None:
+    model = read_model_from_json(jsondata)
+    if model is not None:
+        load_project_from_model(project, model)
+
+
+def read_model_from_json(jsondata: str) -> Project | None:
     jsondict = json.loads(jsondata)
     if jsondict["application"] == "tailor":
         file_version = Version(jsondict["version"])
         if Version(file_version.base_version) < Version("2.0"):
-            model = load_legacy_project(jsondict)
+            return load_legacy_project(jsondict)
         else:
-            model = Project.model_validate(jsondict)
-        load_project_from_model(project, model)
+            return Project.model_validate(jsondict)
+    return None
 
 
 def save_project_to_model(project: "MainWindow"):
@@ -216,9 +257,15 @@ def load_plot(project: "MainWindow", model: Plot, data_sheet: DataSheet) -> Plot
     plot_tab.model._use_fit_domain = model.use_fit_domain
     if model.best_fit:
         plot_tab.model.perform_fit()
-    plot_tab.ui.show_initial_fit.setChecked(model.show_initial_fit)
+    # the plot is refreshed after the project is loaded, so don't draw curves
+    # for every option that is restored
     option_idx = list(DRAW_CURVE_OPTIONS.keys()).index(model.draw_curve_option)
+    for widget in plot_tab.ui.show_initial_fit, plot_tab.ui.draw_curve_option:
+        widget.blockSignals(True)
+    plot_tab.ui.show_initial_fit.setChecked(model.show_initial_fit)
     plot_tab.ui.draw_curve_option.setCurrentIndex(option_idx)
+    for widget in plot_tab.ui.show_initial_fit, plot_tab.ui.draw_curve_option:
+        widget.blockSignals(False)
     return plot_tab
 
 
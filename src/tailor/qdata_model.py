@@ -7,6 +7,7 @@ table view used in the app. This class in this module mostly implements the GUI
 import pathlib
 
 import numpy as np
+import pandas as pd
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from tailor.csv_format_dialog import FormatParameters
@@ -88,14 +89,13 @@ class QDataModel(QtCore.QAbstractTableModel):
         """
         row = index.row()
         col = index.column()
-        label = self.data_model.get_column_label(col)
 
         if role == QtCore.Qt.SizeHintRole:
             return QtCore.QSize()
         elif role in [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole]:
             # request for the data itself
             value = self.data_model.get_value(row, col)
-            if np.isnan(value) and not self.data_model.is_calculated_column(label):
+            if np.isnan(value) and not self.data_model.is_calculated_column_at(col):
                 # NaN in a data column, show as empty
                 return ""
             else:
@@ -108,8 +108,8 @@ class QDataModel(QtCore.QAbstractTableModel):
                     return float(value)
         elif role == QtCore.Qt.BackgroundRole:
             # request for the background fill of the cell
-            if self.data_model.is_calculated_column(label):
-                if self.data_model.is_column_valid(label):
+            if self.data_model.is_calculated_column_at(col):
+                if self.data_model.is_column_valid_at(col):
                     if self.dark_mode_enabled():
                         return QtGui.QBrush(QtGui.QColor(75, 75, 0))
                     else:
@@ -211,8 +211,7 @@ class QDataModel(QtCore.QAbstractTableModel):
             The requested flags.
         """
         flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
-        label = self.data_model.get_column_label(index.column())
-        if not self.data_model.is_calculated_column(label):
+        if not self.data_model.is_calculated_column_at(index.column()):
             # You can only edit data if the column values are not calculated
             flags |= QtCore.Qt.ItemIsEditable
         return flags
@@ -470,8 +469,7 @@ class QDataModel(QtCore.QAbstractTableModel):
         return self.data_model.rename_column(label, name)
 
     def isCalculatedColumn(self, column: int):
-        label = self.data_model.get_column_label(column)
-        return self.data_model.is_calculated_column(label)
+        return self.data_model.is_calculated_column_at(column)
 
     def columnExpression(self, column: int):
         """Get column expression.
@@ -523,7 +521,8 @@ class QDataModel(QtCore.QAbstractTableModel):
         Returns:
             bool: True if successful.
         """
-        for selection_range in selection.toList():
+        ranges = selection.toList()
+        for selection_range in ranges:
             self.data_model.set_values(
                 selection_range.top(),
                 selection_range.left(),
@@ -531,11 +530,15 @@ class QDataModel(QtCore.QAbstractTableModel):
                 selection_range.right(),
                 np.nan,
             )
-            # recalculating vales may have changed all columns to the far right
-            num_columns = self.columnCount()
+        # emit a single signal for all ranges, recalculating values may have
+        # changed all columns to the far right
+        if ranges:
+            top = min(r.top() for r in ranges)
+            left = min(r.left() for r in ranges)
+            bottom = max(r.bottom() for r in ranges)
             self.dataChanged.emit(
-                selection_range.topLeft(),
-                self.createIndex(selection_range.bottom(), num_columns - 1),
+                self.createIndex(top, left),
+                self.createIndex(bottom, self.columnCount() - 1),
             )
         self.main_window.mark_project_dirty()
         return True
@@ -673,3 +676,30 @@ class QDataModel(QtCore.QAbstractTableModel):
         self.data_model.merge_csv(filename, format)
         self.endResetModel()
         self.main_window.mark_project_dirty()
+
+    def import_dataframe(self, df: pd.DataFrame):
+        """Import data from a pandas DataFrame.
+
+        Overwrites all existing data by importing the data frame.
+
+        Args:
+            df (pd.DataFrame): the data to import.
+        """
+        self.beginResetModel()
+        self.data_model.import_dataframe(df)
+        self.endResetModel()
+        self.main_window.mark_project_dirty()
+
+    def merge_dataframe(self, df: pd.DataFrame):
+        """Merge data from a pandas DataFrame into existing data sheet.
+
+        Merges the data with pre-existing data already present in the data
+        sheet.
+
+        Args:
+            df (pd.DataFrame): the data to merge.
+        """
+        self.beginResetModel()
+        self.data_model.merge_dataframe(df)
+        self.endResetModel()
+        self.main_window.mark_project_dirty()
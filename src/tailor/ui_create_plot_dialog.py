@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'create_plot_dialog.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.5.3
+## Created by: Qt User Interface Compiler version 6.6.2
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -85,8 +85,6 @@ class Ui_CreatePlotDialog(object):
         self.retranslateUi(CreatePlotDialog)
         self.buttonBox.accepted.connect(CreatePlotDialog.accept)
         self.buttonBox.rejected.connect(CreatePlotDialog.reject)
-
-        QMetaObject.connectSlotsByName(CreatePlotDialog)
     # setupUi
 
     def retranslateUi(self, CreatePlotDialog):
@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'csv_format_dialog.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.3.2
+## Created by: Qt User Interface Compiler version 6.6.2
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -27,8 +27,6 @@ class Ui_CsvFormatDialog(object):
         CsvFormatDialog.resize(655, 414)
         self.verticalLayout_2 = QVBoxLayout(CsvFormatDialog)
         self.verticalLayout_2.setObjectName(u"verticalLayout_2")
-        self.verticalLayout = QVBoxLayout()
-        self.verticalLayout.setObjectName(u"verticalLayout")
         self.formLayout = QFormLayout()
         self.formLayout.setObjectName(u"formLayout")
         self.formLayout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
@@ -74,7 +72,7 @@ class Ui_CsvFormatDialog(object):
         self.formLayout.setWidget(3, QFormLayout.FieldRole, self.header_row_box)
 
 
-        self.verticalLayout.addLayout(self.formLayout)
+        self.verticalLayout_2.addLayout(self.formLayout)
 
         self.horizontalLayout = QHBoxLayout()
         self.horizontalLayout.setObjectName(u"horizontalLayout")
@@ -99,7 +97,7 @@ class Ui_CsvFormatDialog(object):
         self.horizontalLayout.addWidget(self.preview_text_button)
 
 
-        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
 
         self.preview_box = QPlainTextEdit(CsvFormatDialog)
         self.preview_box.setObjectName(u"preview_box")
@@ -109,10 +107,7 @@ class Ui_CsvFormatDialog(object):
         self.preview_box.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.preview_box.setReadOnly(True)
 
-        self.verticalLayout.addWidget(self.preview_box)
-
-
-        self.verticalLayout_2.addLayout(self.verticalLayout)
+        self.verticalLayout_2.addWidget(self.preview_box)
 
         self.buttonBox = QDialogButtonBox(CsvFormatDialog)
         self.buttonBox.setObjectName(u"buttonBox")
@@ -125,8 +120,6 @@ class Ui_CsvFormatDialog(object):
         self.retranslateUi(CsvFormatDialog)
         self.buttonBox.accepted.connect(CsvFormatDialog.accept)
         self.buttonBox.rejected.connect(CsvFormatDialog.reject)
-
-        QMetaObject.connectSlotsByName(CsvFormatDialog)
     # setupUi
 
     def retranslateUi(self, CsvFormatDialog):
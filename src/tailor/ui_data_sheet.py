@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'data_sheet.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.5.3
+## Created by: Qt User Interface Compiler version 6.6.2
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -28,7 +28,7 @@ class Ui_DataSheet(object):
         self.horizontalLayout.setObjectName(u"horizontalLayout")
         self.data_view = QTableView(DataSheet)
         self.data_view.setObjectName(u"data_view")
-        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         sizePolicy.setHorizontalStretch(1)
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(self.data_view.sizePolicy().hasHeightForWidth())
@@ -72,7 +72,7 @@ class Ui_DataSheet(object):
         self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
         self.add_column_button = QPushButton(self.groupBox)
         self.add_column_button.setObjectName(u"add_column_button")
-        sizePolicy1 = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
         sizePolicy1.setHorizontalStretch(0)
         sizePolicy1.setVerticalStretch(0)
         sizePolicy1.setHeightForWidth(self.add_column_button.sizePolicy().hasHeightForWidth())
@@ -99,8 +99,6 @@ class Ui_DataSheet(object):
 
 
         self.retranslateUi(DataSheet)
-
-        QMetaObject.connectSlotsByName(DataSheet)
     # setupUi
 
     def retranslateUi(self, DataSheet):
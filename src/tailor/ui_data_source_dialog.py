@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'data_source_dialog.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.5.3
+## Created by: Qt User Interface Compiler version 6.6.2
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -95,8 +95,6 @@ class Ui_DataSourceDialog(object):
         self.retranslateUi(DataSourceDialog)
         self.buttonBox.accepted.connect(DataSourceDialog.accept)
         self.buttonBox.rejected.connect(DataSourceDialog.reject)
-
-        QMetaObject.connectSlotsByName(DataSourceDialog)
     # setupUi
 
     def retranslateUi(self, DataSourceDialog):
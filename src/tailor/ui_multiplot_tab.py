@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'multiplot_tab.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.6.0
+## Created by: Qt User Interface Compiler version 6.6.2
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -164,8 +164,6 @@ class Ui_MultiPlotTab(object):
         QWidget.setTabOrder(self.y_min, self.y_max)
 
         self.retranslateUi(MultiPlotTab)
-
-        QMetaObject.connectSlotsByName(MultiPlotTab)
     # setupUi
 
     def retranslateUi(self, MultiPlotTab):
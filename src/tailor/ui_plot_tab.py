@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'plot_tab.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.5.1
+## Created by: Qt User Interface Compiler version 6.6.2
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -186,7 +186,7 @@ class Ui_PlotTab(object):
 
         self.horizontalLayout_3.addWidget(self.fit_start_box)
 
-        self.horizontalSpacer_3 = QSpacerItem(10, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+        self.horizontalSpacer_3 = QSpacerItem(10, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
         self.horizontalLayout_3.addItem(self.horizontalSpacer_3)
 
@@ -201,7 +201,7 @@ class Ui_PlotTab(object):
 
         self.horizontalLayout_3.addWidget(self.fit_end_box)
 
-        self.horizontalSpacer_2 = QSpacerItem(10, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+        self.horizontalSpacer_2 = QSpacerItem(10, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
         self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
 
@@ -225,7 +225,7 @@ class Ui_PlotTab(object):
 
         self.horizontalLayout_4.addWidget(self.draw_curve_option)
 
-        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
         self.horizontalLayout_4.addItem(self.horizontalSpacer_4)
 
@@ -291,8 +291,6 @@ class Ui_PlotTab(object):
         QWidget.setTabOrder(self.y_min, self.y_max)
 
         self.retranslateUi(PlotTab)
-
-        QMetaObject.connectSlotsByName(PlotTab)
     # setupUi
 
     def retranslateUi(self, PlotTab):
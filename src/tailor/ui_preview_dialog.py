@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'preview_dialog.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.5.3
+## Created by: Qt User Interface Compiler version 6.6.2
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -41,8 +41,6 @@ class Ui_PreviewDialog(object):
         self.retranslateUi(PreviewDialog)
         self.buttonBox.accepted.connect(PreviewDialog.accept)
         self.buttonBox.rejected.connect(PreviewDialog.reject)
-
-        QMetaObject.connectSlotsByName(PreviewDialog)
     # setupUi
 
     def retranslateUi(self, PreviewDialog):
@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'rename_dialog.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.5.3
+## Created by: Qt User Interface Compiler version 6.6.2
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -53,8 +53,6 @@ class Ui_RenameDialog(object):
         self.retranslateUi(RenameDialog)
         self.buttonBox.accepted.connect(RenameDialog.accept)
         self.buttonBox.rejected.connect(RenameDialog.reject)
-
-        QMetaObject.connectSlotsByName(RenameDialog)
     # setupUi
 
     def retranslateUi(self, RenameDialog):
@@ -188,8 +188,6 @@ class Ui_MainWindow(object):
 
         self.tabWidget.setCurrentIndex(-1)
 
-
-        QMetaObject.connectSlotsByName(MainWindow)
     # setupUi
 
     def retranslateUi(self, MainWindow):
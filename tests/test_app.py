@@ -1,9 +1,16 @@
+import gzip
+import json
+import os
+import pathlib
+import time
+
 import numpy as np
 import pytest
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtNetwork, QtTest, QtWidgets
 from pytest_mock import MockerFixture
 
-from tailor.app import MainWindow, dialogs
+from tailor import app, config, project_files
+from tailor.app import MainWindow, TabbedWidget, dialogs
 from tailor.data_sheet import DataSheet
 from tailor.multiplot_tab import MultiPlotTab
 from tailor.plot_tab import DRAW_CURVE_OPTIONS, DrawCurve, PlotTab
@@ -291,6 +298,30 @@ class TestSheets:
             in project_with_multiplot.confirm_close_dialog.call_args.args[0]
         )
 
+    def test_close_sheet_with_multiplot_using_sibling_plots(
+        self, simple_project_with_two_plots: MainWindow, mocker: MockerFixture
+    ) -> None:
+        project = simple_project_with_two_plots
+        mocker.patch.object(project, "confirm_close_dialog")
+        project.confirm_close_dialog.return_value = True
+        multiplot_tab = create_multiplot_tab(
+            parent=project, plot_tab=project.ui.tabWidget.widget(2)
+        )
+        multiplot_tab.model.add_plot(
+            project.ui.tabWidget.widget(3), "Label 2", color="#00ff00"
+        )
+        project.ui.tabWidget.addTab(multiplot_tab, multiplot_tab.name)
+
+        # the multiplot uses both plots, but must only be listed once
+        tabs = project.get_associated_tabs(
+            TabbedWidget(widget=project.ui.tabWidget.widget(1), index=1)
+        )
+        assert [t.widget.name for t in tabs] == ["Plot 1", "Plot 2", "Multiplot 1"]
+
+        project.close_tab_with_children(1)
+        assert project.ui.tabWidget.count() == 1
+        assert project.ui.tabWidget.widget(0).name == "Sheet 1"
+
     def test_close_sheet_with_no_plots(
         self, simple_project: MainWindow, mocker: MockerFixture
     ) -> None:
@@ -314,6 +345,21 @@ class TestSheets:
         assert project_with_multiplot.ui.tabWidget.count() == 1
         assert project_with_multiplot.ui.tabWidget.widget(0).name == "Sheet 1"
 
+    def test_close_tabs_handles_tab_change_once(
+        self, project_with_multiplot: MainWindow, mocker: MockerFixture
+    ) -> None:
+        project = project_with_multiplot
+        project.ui.tabWidget.setCurrentIndex(3)
+        mocker.patch.object(project, "tab_changed")
+
+        sheet = project._get_tabs()[1]
+        project.close_tabs([sheet] + project.get_associated_tabs(sheet))
+
+        assert project.ui.tabWidget.count() == 1
+        project.tab_changed.assert_called_once_with(0)
+        assert not project.ui.tabWidget.signalsBlocked()
+        assert project.ui.tabWidget.updatesEnabled()
+
     def test_close_sheet_lists_associated_plots(
         self, project_with_multiplot: MainWindow, mocker: MockerFixture
     ) -> None:
@@ -474,6 +520,22 @@ class TestSheets:
         assert plot1.model._parameters["a"].value == plot2.model._parameters["a"].value
         assert plot1.model.get_model_expression() == plot2.model.get_model_expression()
 
+    def test_tab_changes_refresh_focused_tab_once(
+        self, project_with_multiplot: MainWindow, mocker: MockerFixture
+    ) -> None:
+        project = project_with_multiplot
+        QtWidgets.QApplication.processEvents()
+        mocker.patch.object(project, "update_plot_tab")
+
+        project.ui.tabWidget.setCurrentIndex(2)
+        project.ui.tabWidget.setCurrentIndex(3)
+        project.ui.tabWidget.setCurrentIndex(1)
+        QtWidgets.QApplication.processEvents()
+        project.update_plot_tab.assert_not_called()
+
+        QtTest.QTest.qWait(2 * app.TAB_REFRESH_DELAY)
+        project.update_plot_tab.assert_called_once_with(1)
+
     def test_get_data_sheets(self, simple_project: MainWindow) -> None:
         tabwidget = simple_project.ui.tabWidget
         sheet1 = tabwidget.widget(0)
@@ -484,6 +546,16 @@ class TestSheets:
 
         assert sheets == [sheet1, sheet2]
 
+    def test_create_plot_dialog(self, simple_project: MainWindow) -> None:
+        choices = [None, "x", "y"]
+
+        dialog = simple_project.create_plot_dialog(choices)
+
+        ui = dialog.ui
+        for box in ui.x_axis_box, ui.y_axis_box, ui.x_err_box, ui.y_err_box:
+            assert [box.itemText(idx) for idx in range(box.count())] == ["", "x", "y"]
+            assert box.currentIndex() == 0
+
     def test_change_plot_source(self, project_with_two_sheets: MainWindow) -> None:
         plot: PlotTab = project_with_two_sheets.ui.tabWidget.widget(2)
         sheet3: DataSheet = project_with_two_sheets.ui.tabWidget.widget(3)
@@ -538,3 +610,514 @@ class TestSheets:
 
         simple_project.confirm_project_close_dialog.assert_not_called()
         simple_project.get_open_filename_dialog.assert_called()
+
+
+class TestConfig:
+    def test_config_is_only_read_when_changed(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        config_path = tmp_path / "config.toml"
+        mocker.patch.object(config, "get_config_path", return_value=config_path)
+        config.write_config({"recent_dir": "/foo"})
+        read_config = mocker.spy(config, "read_config")
+        # forget config which was read when creating the main window
+        simple_project._config = None
+
+        assert simple_project.get_recent_directory() == "/foo"
+        simple_project.set_recent_directory(tmp_path)
+        assert simple_project.get_recent_directory() == str(tmp_path)
+        read_config.assert_called_once()
+
+        # file is changed behind our back
+        config.write_config({"recent_dir": "/bar"})
+        os.utime(config_path, ns=(0, 0))
+        assert simple_project.get_recent_directory() == "/bar"
+        assert read_config.call_count == 2
+
+    def test_update_recent_files(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(
+            config, "get_config_path", return_value=tmp_path / "config.toml"
+        )
+        recents = ["a.tlr", "b.tlr", "c.tlr", "d.tlr", "e.tlr"]
+        config.write_config({"recent_files": recents})
+
+        simple_project.update_recent_files("c.tlr")
+        assert config.read_config()["recent_files"] == [
+            "c.tlr",
+            "a.tlr",
+            "b.tlr",
+            "d.tlr",
+            "e.tlr",
+        ]
+
+        simple_project.update_recent_files(pathlib.Path("f.tlr"))
+        assert config.read_config()["recent_files"] == [
+            "f.tlr",
+            "c.tlr",
+            "a.tlr",
+            "b.tlr",
+            "d.tlr",
+        ]
+
+    def test_recent_files_menu_is_updated_incrementally(
+        self, simple_project: MainWindow
+    ) -> None:
+        menu = simple_project.ui.menuOpen_Recent
+
+        def menu_files():
+            return [action.data() for action in menu.actions() if action.data()]
+
+        simple_project.populate_recent_files_menu(["a.tlr", "b.tlr", "c.tlr"])
+        a, b, c = simple_project._recent_files_actions
+
+        simple_project.populate_recent_files_menu(["c.tlr", "a.tlr", "b.tlr"])
+        assert menu_files() == ["c.tlr", "a.tlr", "b.tlr"]
+        assert simple_project._recent_files_actions[1:] == [a, b]
+
+        simple_project.populate_recent_files_menu(["b.tlr", "d.tlr"])
+        assert menu_files() == ["b.tlr", "d.tlr"]
+
+    def test_recent_files_menu_is_rebuilt_after_emptying(
+        self, simple_project: MainWindow
+    ) -> None:
+        menu = simple_project.ui.menuOpen_Recent
+
+        def menu_files():
+            return [action.data() for action in menu.actions() if action.data()]
+
+        simple_project.populate_recent_files_menu(["a.tlr", "b.tlr"])
+        simple_project.populate_recent_files_menu([])
+        assert menu_files() == []
+        assert simple_project._recent_files_actions is None
+        assert not simple_project.ui.actionClear_Menu.isEnabled()
+
+        simple_project.populate_recent_files_menu(["c.tlr"])
+        assert menu_files() == ["c.tlr"]
+        assert simple_project.ui.actionClear_Menu.isEnabled()
+
+    def test_missing_recent_files_are_disabled(
+        self, simple_project: MainWindow, tmp_path
+    ) -> None:
+        (tmp_path / "a.tlr").touch()
+        (tmp_path / "subdir").mkdir()
+        recents = [
+            str(tmp_path / "a.tlr"),
+            str(tmp_path / "b.tlr"),
+            str(tmp_path / "subdir"),
+            str(tmp_path / "missing" / "c.tlr"),
+        ]
+        simple_project.populate_recent_files_menu(recents)
+        enabled = [a.isEnabled() for a in simple_project._recent_files_actions]
+        assert enabled == [True, True, True, True]
+
+        simple_project.ui.menuOpen_Recent.aboutToShow.emit()
+        enabled = [a.isEnabled() for a in simple_project._recent_files_actions]
+        assert enabled == [True, False, False, False]
+
+        (tmp_path / "b.tlr").touch()
+        simple_project.ui.menuOpen_Recent.aboutToShow.emit()
+        enabled = [a.isEnabled() for a in simple_project._recent_files_actions]
+        assert enabled == [True, True, False, False]
+
+    def test_open_recent_file(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        open_recent = mocker.patch.object(simple_project, "open_recent_project_action")
+        recents = [str(tmp_path / "a.tlr"), str(tmp_path / "b.tlr")]
+        for filename in recents:
+            pathlib.Path(filename).touch()
+        simple_project.populate_recent_files_menu(recents)
+
+        simple_project._recent_files_actions[1].trigger()
+        open_recent.assert_called_once_with(str(tmp_path / "b.tlr"))
+
+
+class TestFileDialogs:
+    def test_file_dialog_is_reused(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(simple_project, "get_recent_directory", return_value=None)
+        exec = mocker.patch.object(
+            QtWidgets.QFileDialog, "exec", return_value=QtWidgets.QDialog.Accepted
+        )
+        mocker.patch.object(
+            QtWidgets.QFileDialog, "selectedFiles", return_value=["/foo/bar.tlr"]
+        )
+
+        assert simple_project.get_open_filename_dialog("*.tlr") == "/foo/bar.tlr"
+        dialog = simple_project._open_file_dialog
+        exec.return_value = QtWidgets.QDialog.Rejected
+        assert simple_project.get_open_filename_dialog("*.csv") is None
+        assert simple_project._open_file_dialog is dialog
+        assert dialog.nameFilters() == ["*.csv"]
+
+    def test_export_graph_adds_suffix(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(simple_project, "get_recent_directory", return_value=None)
+        mocker.patch.object(simple_project, "set_recent_directory")
+        mocker.patch.object(
+            QtWidgets.QFileDialog, "exec", return_value=QtWidgets.QDialog.Accepted
+        )
+        mocker.patch.object(
+            QtWidgets.QFileDialog,
+            "selectedFiles",
+            return_value=[str(tmp_path / "a.pdf")],
+        )
+        simple_project.ui.tabWidget.setCurrentIndex(2)
+        plot = simple_project.ui.tabWidget.currentWidget()
+        export_graph = mocker.patch.object(plot, "export_graph")
+
+        simple_project.export_graph(".pdf")
+
+        assert simple_project._save_file_dialog.defaultSuffix() == "pdf"
+        export_graph.assert_called_once_with(tmp_path / "a.pdf")
+
+    def test_non_native_file_dialogs(self, simple_project: MainWindow) -> None:
+        simple_project._config = {"native_file_dialogs": False}
+        simple_project._config_mtime = simple_project._get_config_mtime()
+        dialog = simple_project.create_file_dialog(QtWidgets.QFileDialog.AcceptSave)
+        assert dialog.testOption(QtWidgets.QFileDialog.DontUseNativeDialog)
+
+
+class TestSave:
+    def test_save_project_in_worker_thread(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        project = simple_project
+        mocker.patch.object(project, "update_recent_files")
+        project.mark_project_dirty()
+        filename = str(tmp_path / "project.tlr")
+
+        project.save_project(filename)
+        assert not project.ui.actionSave.isEnabled()
+        assert not project.ui.actionSave_As.isEnabled()
+        assert project._progress_dialog.isVisible()
+
+        project.wait_for_save()
+        assert project.ui.actionSave.isEnabled()
+        assert project.ui.actionSave_As.isEnabled()
+        assert project._progress_dialog is None
+        assert project._project_filename == filename
+        assert project._is_dirty is False
+        assert project.windowTitle() == "Tailor: project"
+        project.update_recent_files.assert_called_once_with(filename)
+        assert (tmp_path / "project.tlr").exists()
+
+    def test_close_waits_for_save_in_progress(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        project = simple_project
+        mocker.patch.object(project, "update_recent_files")
+        warning = mocker.patch.object(QtWidgets.QMessageBox, "warning")
+        project.mark_project_dirty()
+        path = tmp_path / "project.tlr"
+
+        project.save_project(str(path))
+        assert project.confirm_project_close_dialog() is True
+        # the save finished and marked the project clean, so no dialog
+        warning.assert_not_called()
+        assert project._is_saving is False
+        assert project._is_dirty is False
+        with gzip.open(path, mode="rt", encoding="utf-8") as f:
+            json.load(f)
+        assert not (tmp_path / "project.tlr.tmp").exists()
+
+    def test_save_project_shows_exception(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        project = simple_project
+        show_exception = mocker.patch("tailor.dialogs.show_exception")
+        project.mark_project_dirty()
+
+        project.save_project(str(tmp_path / "missing" / "project.tlr"))
+        project.wait_for_save()
+        show_exception.assert_called_once()
+        assert project.ui.actionSave.isEnabled()
+        assert project._project_filename is None
+        assert project._is_dirty is True
+
+
+class TestLoad:
+    def test_load_project_in_worker_thread(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        path = tmp_path / "project.tlr"
+        project_files.save_project_to_path(simple_project, path)
+        project = MainWindow(add_sheet=True)
+        mocker.patch.object(project, "update_recent_files")
+        project.mark_project_dirty()
+
+        project.load_project(str(path))
+        project.wait_for_load()
+        assert project._project_filename == str(path)
+        assert project._is_dirty is False
+        assert project._progress_dialog is None
+        assert project.ui.tabWidget.count() == 3
+        project.update_recent_files.assert_called_once_with(str(path))
+
+    def test_load_project_keeps_project_on_error(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        project = simple_project
+        show_exception = mocker.patch("tailor.dialogs.show_exception")
+
+        project.load_project(str(tmp_path / "missing.tlr"))
+        project.wait_for_load()
+        show_exception.assert_called_once()
+        assert project.ui.tabWidget.count() == 3
+        assert project._project_filename is None
+
+    def test_load_project_refreshes_tabs_once(
+        self, project_with_multiplot: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        path = tmp_path / "project.tlr"
+        project_files.save_project_to_path(project_with_multiplot, path)
+        project = MainWindow(add_sheet=True)
+        mocker.patch.object(project, "update_recent_files")
+        mocker.patch.object(project, "update_plot_tab")
+        refresh_multiplot = mocker.spy(MultiPlotTab, "refresh_ui")
+
+        project.load_project(str(path))
+        project.wait_for_load()
+        # tabs are refreshed one at a time from the event loop
+        while project._tabs_to_refresh:
+            QtWidgets.QApplication.processEvents()
+        QtWidgets.QApplication.processEvents()
+        # once on construction and once after loading the project
+        assert refresh_multiplot.call_count == 2
+        project.update_plot_tab.assert_not_called()
+
+    def test_closed_tabs_are_not_refreshed_after_load(
+        self, project_with_multiplot: MainWindow, mocker: MockerFixture
+    ) -> None:
+        project = project_with_multiplot
+        plot, multiplot = project.get_plots()[0], project.ui.tabWidget.widget(3)
+        project.ui.tabWidget.setCurrentWidget(plot)
+        project._tabs_to_refresh.extend([plot, multiplot])
+        refresh_multiplot = mocker.patch.object(multiplot, "refresh_ui")
+        project.ui.tabWidget.removeTab(3)
+
+        project.refresh_next_loaded_tab()
+        while project._tabs_to_refresh:
+            QtWidgets.QApplication.processEvents()
+        refresh_multiplot.assert_not_called()
+
+
+class TestWindowTitle:
+    def test_window_title_is_only_set_when_changed(
+        self, simple_project: MainWindow, mocker: MockerFixture
+    ) -> None:
+        project = simple_project
+        project.mark_project_dirty()
+        set_title = mocker.spy(project, "setWindowTitle")
+        project.mark_project_dirty()
+        set_title.assert_not_called()
+        project.mark_project_dirty(False)
+        set_title.assert_called_once_with("Tailor")
+
+    def test_marking_project_dirty_twice_skips_title_update(
+        self, simple_project: MainWindow, mocker: MockerFixture
+    ) -> None:
+        project = simple_project
+        project.mark_project_dirty()
+        update_title = mocker.patch.object(project, "update_window_title")
+        project.mark_project_dirty()
+        update_title.assert_not_called()
+        project.mark_project_dirty(False)
+        update_title.assert_called_once()
+
+
+class TestUpdates:
+    RELEASE_INFO = {
+        "name": "99.0.0",
+        "html_url": "https://example.com/release",
+        "assets": [
+            {"browser_download_url": "https://example.com/tailor.dmg"},
+            {"browser_download_url": "https://example.com/tailor.msi"},
+        ],
+    }
+
+    def test_get_latest_version_and_update_link(
+        self, simple_project: MainWindow, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("platform.system", return_value="Windows")
+        mocker.patch("platform.machine", return_value="AMD64")
+        assert simple_project.get_latest_version_and_update_link(self.RELEASE_INFO) == (
+            "99.0.0",
+            "https://example.com/tailor.msi",
+            "https://example.com/release",
+        )
+
+    @pytest.mark.parametrize(
+        "system, machine, assets, expected",
+        [
+            (
+                "Darwin",
+                "arm64",
+                ["intel.dmg", "apple_silicon.dmg"],
+                "apple_silicon.dmg",
+            ),
+            ("Darwin", "arm64", ["tailor.msi", "tailor.dmg"], "tailor.dmg"),
+            ("Darwin", "x86_64", ["apple_silicon.dmg", "intel.dmg"], "intel.dmg"),
+            ("Windows", "ARM64", ["tailor.dmg", "tailor.msi"], "tailor.msi"),
+            ("Windows", "AMD64", ["tailor.dmg"], None),
+            ("Linux", "x86_64", ["tailor.dmg", "tailor.msi"], None),
+        ],
+    )
+    def test_update_link_for_platform(
+        self,
+        simple_project: MainWindow,
+        mocker: MockerFixture,
+        system,
+        machine,
+        assets,
+        expected,
+    ) -> None:
+        mocker.patch("platform.system", return_value=system)
+        mocker.patch("platform.machine", return_value=machine)
+        release_info = self.RELEASE_INFO | {
+            "assets": [{"browser_download_url": asset} for asset in assets]
+        }
+        _, update_link, _ = simple_project.get_latest_version_and_update_link(
+            release_info
+        )
+        assert update_link == expected
+
+    def test_no_update_link_for_old_version(self, simple_project: MainWindow) -> None:
+        release_info = self.RELEASE_INFO | {"name": "0.1.0"}
+        assert simple_project.get_latest_version_and_update_link(release_info) == (
+            "0.1.0",
+            None,
+            "https://example.com/release",
+        )
+
+    def test_silent_update_check_without_connection(
+        self, simple_project: MainWindow, mocker: MockerFixture
+    ) -> None:
+        message_box = mocker.patch.object(QtWidgets, "QMessageBox")
+        reply = mocker.Mock()
+        reply.error.return_value = QtNetwork.QNetworkReply.HostNotFoundError
+        simple_project.release_info_received(reply, silent=True)
+        reply.deleteLater.assert_called_once()
+        message_box.assert_not_called()
+
+    def test_update_check_request(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(
+            config, "get_config_path", return_value=tmp_path / "config.toml"
+        )
+        get = mocker.patch.object(QtNetwork.QNetworkAccessManager, "get")
+        simple_project.check_for_updates()
+
+        (request,) = get.call_args.args
+        assert request.url().toString() == app.RELEASE_API_URL
+        assert request.transferTimeout() == app.HTTP_TIMEOUT * 1000
+        assert request.header(QtNetwork.QNetworkRequest.UserAgentHeader).startswith(
+            "tailor/"
+        )
+
+    def test_silent_update_check_uses_cached_release_info(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(
+            config, "get_config_path", return_value=tmp_path / "config.toml"
+        )
+        show_update_info = mocker.patch.object(simple_project, "show_update_info")
+        get = mocker.patch.object(QtNetwork.QNetworkAccessManager, "get")
+
+        simple_project.write_cached_release_info(self.RELEASE_INFO)
+        simple_project.check_for_updates(silent=True)
+        # the release information is shown once the event loop runs
+        show_update_info.assert_not_called()
+        QtWidgets.QApplication.processEvents()
+        show_update_info.assert_called_once_with(self.RELEASE_INFO, True)
+        get.assert_not_called()
+
+    def test_outdated_release_info_is_ignored(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(
+            config, "get_config_path", return_value=tmp_path / "config.toml"
+        )
+        simple_project.write_cached_release_info(self.RELEASE_INFO)
+        mocker.patch("time.time", return_value=time.time() + 2 * 3600)
+        cache = simple_project.read_release_info_cache()
+        assert not simple_project.is_fresh(cache)
+
+    def test_update_check_sends_cached_etag(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(
+            config, "get_config_path", return_value=tmp_path / "config.toml"
+        )
+        get = mocker.patch.object(QtNetwork.QNetworkAccessManager, "get")
+
+        simple_project.write_cached_release_info(self.RELEASE_INFO, etag='"abc"')
+        simple_project.check_for_updates()
+
+        (request,) = get.call_args.args
+        assert request.rawHeader(b"If-None-Match").data() == b'"abc"'
+
+    def test_not_modified_release_info_is_reused(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(
+            config, "get_config_path", return_value=tmp_path / "config.toml"
+        )
+        show_update_info = mocker.patch.object(simple_project, "show_update_info")
+        simple_project.write_cached_release_info(self.RELEASE_INFO, etag='"abc"')
+        mocker.patch("time.time", return_value=time.time() + 2 * 3600)
+        reply = mocker.Mock()
+        reply.error.return_value = QtNetwork.QNetworkReply.NoError
+        reply.attribute.return_value = 304
+        reply.rawHeader.return_value = QtCore.QByteArray()
+
+        simple_project.release_info_received(reply, silent=True)
+
+        reply.readAll.assert_not_called()
+        show_update_info.assert_called_once_with(self.RELEASE_INFO, True)
+        # the cached release information is fresh again
+        cache = simple_project.read_release_info_cache()
+        assert simple_project.is_fresh(cache)
+        assert cache["release_info"] == self.RELEASE_INFO
+        assert cache["etag"] == '"abc"'
+
+    def test_not_modified_without_cache(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(
+            config, "get_config_path", return_value=tmp_path / "config.toml"
+        )
+        show_update_info = mocker.patch.object(simple_project, "show_update_info")
+        reply = mocker.Mock()
+        reply.error.return_value = QtNetwork.QNetworkReply.NoError
+        reply.attribute.return_value = 304
+        reply.rawHeader.return_value = QtCore.QByteArray(b'"abc"')
+
+        simple_project.release_info_received(reply, silent=True)
+
+        reply.readAll.assert_not_called()
+        show_update_info.assert_called_once_with(None, True)
+        assert simple_project.read_release_info_cache() is None
+
+    def test_malformed_release_info_is_ignored(
+        self, simple_project: MainWindow, mocker: MockerFixture, tmp_path
+    ) -> None:
+        mocker.patch.object(
+            config, "get_config_path", return_value=tmp_path / "config.toml"
+        )
+        show_update_info = mocker.patch.object(simple_project, "show_update_info")
+        reply = mocker.Mock()
+        reply.error.return_value = QtNetwork.QNetworkReply.NoError
+        reply.attribute.return_value = 200
+        reply.rawHeader.return_value = QtCore.QByteArray()
+        reply.readAll.return_value = QtCore.QByteArray(b"<html>")
+
+        simple_project.release_info_received(reply, silent=True)
+
+        show_update_info.assert_called_once_with(None, True)
+        assert simple_project.read_release_info_cache() is None
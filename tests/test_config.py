@@ -0,0 +1,64 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from tailor import config
+
+
+@pytest.fixture(autouse=True)
+def config_path(mocker: MockerFixture, tmp_path):
+    path = tmp_path / "tailor" / "config.toml"
+    mocker.patch.object(config, "get_config_path", return_value=path)
+    return path
+
+
+def test_update_config_creates_file(config_path):
+    cfg = config.update_config(recent_dir="/foo")
+    assert cfg == {"recent_dir": "/foo"}
+    assert config.read_config() == {"recent_dir": "/foo"}
+
+
+def test_update_config_keeps_other_keys():
+    config.write_config({"recent_dir": "/foo", "recent_files": ["a.tlr", "b.tlr"]})
+    cfg = config.update_config(recent_files=["ü.tlr"])
+    assert cfg == {"recent_dir": "/foo", "recent_files": ["ü.tlr"]}
+    assert config.read_config() == cfg
+
+
+def test_update_config_overwrites_corrupt_file(config_path):
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text("this is not = valid TOML [")
+    cfg = config.update_config(recent_dir="/foo")
+    assert cfg == {"recent_dir": "/foo"}
+    assert config.read_config() == cfg
+
+
+def test_update_config_leaves_file_intact_on_error():
+    config.write_config({"recent_dir": "/foo"})
+    with pytest.raises(TypeError):
+        config.update_config(recent_dir=object())
+    assert config.read_config() == {"recent_dir": "/foo"}
+
+
+def test_update_config_replaces_file(config_path, mocker: MockerFixture):
+    config.write_config({"recent_dir": "/foo"})
+    replace = mocker.spy(config.os, "replace")
+
+    config.update_config(recent_dir="/bar")
+
+    replace.assert_called_once_with(config_path.with_suffix(".toml.tmp"), config_path)
+    assert config.read_config() == {"recent_dir": "/bar"}
+    assert list(config_path.parent.iterdir()) == [config_path]
+
+
+def test_write_config_replaces_file(config_path):
+    config.write_config({"recent_dir": "/foo"})
+    config.write_config({"recent_dir": "/bar"})
+    assert config.read_config() == {"recent_dir": "/bar"}
+    assert list(config_path.parent.iterdir()) == [config_path]
+
+
+def test_write_config_leaves_file_intact_on_error():
+    config.write_config({"recent_dir": "/foo"})
+    with pytest.raises(TypeError):
+        config.write_config({"recent_dir": object()})
+    assert config.read_config() == {"recent_dir": "/foo"}
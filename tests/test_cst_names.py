@@ -1,6 +1,12 @@
 import pytest
 
-from tailor.cst_names import get_variable_names, rename_variables
+from tailor.cst_names import (
+    get_variable_names,
+    get_variable_names_with_cst,
+    rename_variables,
+    rename_variables_with_cst,
+    tokenize_expression,
+)
 
 
 @pytest.mark.parametrize(
@@ -15,6 +21,26 @@ def test_renaming_variables(expression, mapping, expected):
     assert rename_variables(expression, mapping) == expected
 
 
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "(x\n +  y)",
+        "x.y + f(x=y)",
+        "lambda x: x + y",
+        "x  *  y  # y and x",
+        "x and not y",
+        "xx + x_ + x",
+        "f'{x}' + y",
+        "'x' + x",
+    ],
+)
+def test_renaming_variables_matches_cst(expression):
+    mapping = {"x": "col1", "y": "a_longer_name"}
+    assert rename_variables(expression, mapping) == rename_variables_with_cst(
+        expression, mapping
+    )
+
+
 @pytest.mark.parametrize(
     "expression, expected",
     [
@@ -27,7 +53,32 @@ def test_get_variables_name(expression, expected):
     assert get_variable_names(expression) == expected
 
 
+@pytest.mark.parametrize(
+    "expression",
+    ["(x\n +  y)", "x.y + f(x=y)", "lambda x: x + y", "x and not y", "f'{x}' + y"],
+)
+def test_get_variable_names_matches_cst(expression):
+    assert get_variable_names(expression) == get_variable_names_with_cst(expression)
+
+
+def test_expression_is_tokenized_once():
+    tokenize_expression.cache_clear()
+
+    get_variable_names("a * x + b")
+    rename_variables("a * x + b", {"x": "col1"})
+
+    info = tokenize_expression.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
 @pytest.mark.parametrize("expression", ["y * ", "y = 4"])
 def test_get_variables_name_raises_exception(expression):
     with pytest.raises(SyntaxError):
         get_variable_names(expression)
+
+
+@pytest.mark.parametrize("expression", ["y * ", "y = 4", " y"])
+def test_rename_variables_raises_exception(expression):
+    with pytest.raises(SyntaxError):
+        rename_variables(expression, {"y": "col1"})
@@ -0,0 +1,92 @@
+import math
+
+import pandas as pd
+import pytest
+from PySide6 import QtTest
+
+from tailor import csv_format_dialog
+from tailor.csv_format_dialog import (
+    PREVIEW_DELAY,
+    PREVIEW_LINES,
+    PREVIEW_ROWS,
+    CSVFormatDialog,
+    FormatParameters,
+    read_csv,
+)
+
+
+@pytest.fixture()
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    lines = ["x,y"] + [f"{i},{i ** 2}" for i in range(2 * PREVIEW_ROWS)]
+    path.write_text("\n".join(lines))
+    return path
+
+
+@pytest.fixture()
+def small_csv_file(tmp_path):
+    path = tmp_path / "small.csv"
+    path.write_text("x,y\n1,1\n2,4\n3,9\n")
+    return path
+
+
+class TestCSVFormatDialog:
+    def test_preview_only_parses_first_rows(self, csv_file) -> None:
+        dialog = CSVFormatDialog(csv_file, parent=None)
+
+        assert len(dialog.get_preview_dataframe()) == PREVIEW_ROWS
+        assert len(dialog.get_dataframe()) == 2 * PREVIEW_ROWS
+
+    def test_complete_preview_is_reused(self, small_csv_file, mocker) -> None:
+        dialog = CSVFormatDialog(small_csv_file, parent=None)
+        read_csv = mocker.spy(csv_format_dialog, "read_csv")
+
+        df = dialog.get_dataframe()
+
+        read_csv.assert_not_called()
+        assert df is dialog.get_preview_dataframe()
+        assert list(df["y"]) == [1, 4, 9]
+
+    def test_format_changes_update_preview_once(self, csv_file, mocker) -> None:
+        dialog = CSVFormatDialog(csv_file, parent=None)
+        read_csv = mocker.spy(csv_format_dialog, "read_csv")
+
+        dialog.ui.header_row_box.setValue(1)
+        dialog.ui.header_row_box.setValue(12)
+        read_csv.assert_not_called()
+
+        QtTest.QTest.qWait(2 * PREVIEW_DELAY)
+        read_csv.assert_called_once()
+        assert dialog.get_format_parameters().header == 12
+
+    def test_plain_text_preview_shows_first_lines(self, tmp_path) -> None:
+        path = tmp_path / "data.csv"
+        path.write_text("".join(f"{i}\n" for i in range(2 * PREVIEW_LINES)))
+        dialog = CSVFormatDialog(path, parent=None)
+
+        dialog.ui.preview_text_button.setChecked(True)
+        dialog.show_preview()
+
+        lines = dialog.ui.preview_box.toPlainText().splitlines()
+        assert lines[:PREVIEW_LINES] == [str(i) for i in range(PREVIEW_LINES)]
+        assert lines[-1] == "... (truncated) ..."
+
+    def test_preview_keeps_no_undo_history(self, small_csv_file) -> None:
+        dialog = CSVFormatDialog(small_csv_file, parent=None)
+        assert not dialog.ui.preview_box.isUndoRedoEnabled()
+
+    def test_large_files_are_read_in_chunks(self, csv_file, mocker) -> None:
+        mocker.patch.object(csv_format_dialog, "IMPORT_CHUNK_ROWS", 150)
+        dialog = CSVFormatDialog(csv_file, parent=None)
+        assert not dialog.is_preview_complete()
+
+        df = dialog.get_dataframe()
+
+        pd.testing.assert_frame_equal(df, read_csv(csv_file, FormatParameters()))
+
+
+def test_read_csv_in_chunks(csv_file, mocker) -> None:
+    progress = mocker.Mock()
+    df = read_csv(csv_file, FormatParameters(), chunksize=7, progress=progress)
+    pd.testing.assert_frame_equal(df, read_csv(csv_file, FormatParameters()))
+    assert progress.call_count == math.ceil(len(df) / 7)
@@ -108,6 +108,23 @@ class TestDataModel:
         assert bare_bones_data.get_value(2, 1) == 8.0
         assert bare_bones_data.get_value(3, 0) == 4.0
 
+    def test_get_value_caches_column_values(self, bare_bones_data: DataModel):
+        values = bare_bones_data._get_column_array(1)
+        assert bare_bones_data._get_column_array(1) is values
+        bare_bones_data.set_value(0, 1, 4.7)
+        assert bare_bones_data._get_column_array(1) is not values
+
+    def test_get_value_after_modifications(self, bare_bones_data: DataModel):
+        assert bare_bones_data.get_value(0, 0) == 1.0
+        bare_bones_data.set_value(0, 0, 4.7)
+        assert bare_bones_data.get_value(0, 0) == 4.7
+        bare_bones_data.insert_rows(0, 1)
+        assert np.isnan(bare_bones_data.get_value(0, 0))
+        bare_bones_data.insert_columns(0, 1)
+        assert bare_bones_data.get_value(1, 1) == 4.7
+        bare_bones_data.update_column_expression("col3", "col2 * 2")
+        assert bare_bones_data.get_value(1, 3) == 12.0
+
     def test_get_values_returns_data(self, bare_bones_data: DataModel):
         values = bare_bones_data.get_values(1, 1, 4, 2)
 
@@ -124,15 +141,12 @@ class TestDataModel:
     def test_set_value_triggers_recalculation(
         self, bare_bones_data: DataModel, mocker: MockerFixture
     ):
-        mocker.patch.object(bare_bones_data, "recalculate_columns_from")
-        mocker.patch.object(bare_bones_data, "get_column_label")
-        bare_bones_data.get_column_label.return_value = sentinel.label
+        mocker.patch.object(bare_bones_data, "recalculate_columns_using")
 
-        bare_bones_data.set_value(row=1, column=2, value=3.0)
+        bare_bones_data.set_value(row=1, column=1, value=3.0)
 
-        # recalculate all columns starting from start_column
-        bare_bones_data.get_column_label.assert_called_with(2)
-        bare_bones_data.recalculate_columns_from.assert_called_with(sentinel.label)
+        # recalculate all columns using the updated column
+        bare_bones_data.recalculate_columns_using.assert_called_with(["col2"])
 
     def test_set_values(self, bare_bones_data: DataModel):
         # no calculated columns, only data
@@ -150,17 +164,14 @@ class TestDataModel:
     def test_set_values_triggers_recalculation(
         self, bare_bones_data: DataModel, mocker: MockerFixture
     ):
-        mocker.patch.object(bare_bones_data, "recalculate_columns_from")
-        mocker.patch.object(bare_bones_data, "get_column_label")
-        bare_bones_data.get_column_label.return_value = sentinel.label
+        mocker.patch.object(bare_bones_data, "recalculate_columns_using")
 
         bare_bones_data.set_values(
-            start_row=1, start_column=2, end_row=3, end_column=4, value=0.0
+            start_row=1, start_column=0, end_row=3, end_column=1, value=0.0
         )
 
-        # recalculate all columns starting from start_column
-        bare_bones_data.get_column_label.assert_called_with(2)
-        bare_bones_data.recalculate_columns_from.assert_called_with(sentinel.label)
+        # recalculate all columns using the updated columns
+        bare_bones_data.recalculate_columns_using.assert_called_with(["col1", "col2"])
 
     def test_set_values_from_array(self, bare_bones_data: DataModel):
         # no calculated columns, only data
@@ -180,17 +191,14 @@ class TestDataModel:
     def test_set_values_from_array_triggers_recalculation(
         self, bare_bones_data: DataModel, mocker: MockerFixture
     ):
-        mocker.patch.object(bare_bones_data, "recalculate_columns_from")
-        mocker.patch.object(bare_bones_data, "get_column_label")
-        bare_bones_data.get_column_label.return_value = sentinel.label
+        mocker.patch.object(bare_bones_data, "recalculate_columns_using")
 
         bare_bones_data.set_values_from_array(
-            start_row=1, start_column=2, values=np.array([[1.0]])
+            start_row=1, start_column=1, values=np.array([[1.0, 2.0]])
         )
 
-        # recalculate all columns starting from start_column
-        bare_bones_data.get_column_label.assert_called_with(2)
-        bare_bones_data.recalculate_columns_from.assert_called_with(sentinel.label)
+        # recalculate all columns using the updated columns
+        bare_bones_data.recalculate_columns_using.assert_called_with(["col2", "col3"])
 
     def test_insert_rows(self, bare_bones_data: DataModel):
         bare_bones_data.insert_rows(3, 4)
@@ -226,6 +234,18 @@ class TestDataModel:
         assert list(bare_bones_data._data["col2"]) == pytest.approx([6.0, 9.0, 10.0])
         assert list(bare_bones_data._data.index) == list(range(3))
 
+    def test_remove_all_rows_keeps_columns(self, bare_bones_data: DataModel):
+        bare_bones_data.remove_rows(0, 5)
+        assert bare_bones_data._data.shape == (0, 3)
+        assert bare_bones_data.get_column_labels() == ["col1", "col2", "col3"]
+
+    def test_insert_rows_into_integer_column(self, model: DataModel):
+        model.import_dataframe(pd.DataFrame({"x": [1, 2]}))
+        model.insert_rows(1, 1)
+        assert list(model.get_column("col1")) == pytest.approx(
+            [1.0, np.nan, 2.0], nan_ok=True
+        )
+
     def test_insert_columns(self, bare_bones_data: DataModel):
         bare_bones_data.insert_columns(1, 2)
         assert bare_bones_data._data.shape == (5, 5)
@@ -339,6 +359,26 @@ class TestDataModel:
         actual = [bare_bones_data.get_column_label(idx) for idx in range(3)]
         assert actual == expected
 
+    def test_get_column_label_after_structural_changes(
+        self, bare_bones_data: DataModel
+    ):
+        assert bare_bones_data.get_column_label(0) == "col1"
+        bare_bones_data.insert_columns(0, 1)
+        assert bare_bones_data.get_column_label(0) == "col4"
+        bare_bones_data.move_column(0, 3)
+        assert bare_bones_data.get_column_label(3) == "col4"
+        bare_bones_data.remove_columns(0, 1)
+        assert bare_bones_data.get_column_label(0) == "col2"
+
+    def test_column_index_after_structural_changes(self, bare_bones_data: DataModel):
+        assert bare_bones_data._get_column_index("col3") == 2
+        bare_bones_data.move_column(2, 0)
+        assert bare_bones_data._get_column_index("col3") == 0
+        bare_bones_data.insert_columns(0, 1)
+        assert bare_bones_data._get_column_index("col3") == 1
+        with pytest.raises(KeyError):
+            bare_bones_data._get_column_index("col99")
+
     def test_get_column_label_by_name(self, bare_bones_data: DataModel) -> None:
         names = ["x", "y", "z"]
         expected = ["col1", "col2", "col3"]
@@ -388,6 +428,20 @@ class TestDataModel:
         assert bare_bones_data.is_calculated_column("col1") is False
         assert bare_bones_data.is_calculated_column("col3") is True
 
+    def test_column_properties_by_index(self, calc_model: DataModel):
+        calculated = [calc_model.is_calculated_column_at(i) for i in range(5)]
+        valid = [calc_model.is_column_valid_at(i) for i in range(5)]
+        assert calculated == [True, True, False, True, True]
+        assert valid == [True, True, True, True, False]
+
+        calc_model.update_column_expression("col5", "col1 + 1")
+        calc_model.remove_columns(0, 1)
+        calc_model.insert_calculated_column(0)
+        calculated = [calc_model.is_calculated_column_at(i) for i in range(5)]
+        valid = [calc_model.is_column_valid_at(i) for i in range(5)]
+        assert calculated == [True, True, False, True, True]
+        assert valid == [False, False, True, False, False]
+
     def test_is_column_valid(self, bare_bones_data: DataModel):
         # not calculated
         assert bare_bones_data.is_column_valid("col1") is True
@@ -480,6 +534,37 @@ class TestDataModel:
         expected = [call("col2"), call("col4"), call("col5")]
         assert calc_model.recalculate_column.call_args_list == expected
 
+    @pytest.mark.parametrize(
+        "labels, expected",
+        [
+            (["col3"], []),
+            (["col2"], ["col2", "col4"]),
+            (["col1"], ["col1", "col2", "col4"]),
+            (["col3", "col5"], ["col5"]),
+        ],
+    )
+    def test_recalculate_columns_using(
+        self, calc_model: DataModel, mocker: MockerFixture, labels, expected
+    ):
+        mocker.patch.object(calc_model, "recalculate_column")
+
+        calc_model.recalculate_columns_using(labels)
+
+        assert calc_model.recalculate_column.call_args_list == [
+            call(label) for label in expected
+        ]
+
+    def test_recalculate_columns_using_name_in_expression(
+        self, calc_model: DataModel, mocker: MockerFixture
+    ):
+        # expression refers to a column name which is not yet locked in
+        calc_model._calculated_column_expression["col5"] = "z + 1"
+        mocker.patch.object(calc_model, "recalculate_column")
+
+        calc_model.recalculate_columns_using(["col3"])
+
+        calc_model.recalculate_column.assert_called_once_with("col5")
+
     def test_recalculate_all_columns(
         self, calc_model: DataModel, mocker: MockerFixture
     ):
@@ -552,6 +637,30 @@ class TestDataModel:
         assert is_valid is False
         assert calc_model.is_column_valid("col2") is False
 
+    def test_recalculate_column_reuses_interpreter(self, calc_model: DataModel):
+        calc_model.recalculate_column("col2")
+        interpreter = calc_model._interpreter
+
+        calc_model.recalculate_column("col4")
+
+        assert calc_model._interpreter is interpreter
+        assert list(calc_model._data["col4"]) == pytest.approx([1.0, 2.0, 3.0])
+
+    def test_recalculate_column_does_not_leak_symbols(self, calc_model: DataModel):
+        calc_model._calculated_column_expression["col2"] = "a = 2; a * x"
+        calc_model._calculated_column_expression["col4"] = "a * y"
+
+        assert calc_model.recalculate_column("col2") is True
+        assert calc_model.recalculate_column("col4") is False
+        # columns to the right are not accessible
+        calc_model._calculated_column_expression["col1"] = "t"
+        assert calc_model.recalculate_column("col1") is False
+
+    def test_recalculate_column_with_syntax_error(self, calc_model: DataModel):
+        calc_model._calculated_column_expression["col2"] = "col1 +"
+        assert calc_model.recalculate_column("col2") is False
+        assert calc_model.is_column_valid("col2") is False
+
     def test_export_csv(
         self, simple_test_data: DataModel, tmp_path: pathlib.Path
     ) -> None:
@@ -609,6 +718,16 @@ x,y
         assert model.get_column_names() == ["x", "y"]
         assert list(model.get_values(0, 1, 2, 1)) == pytest.approx([0.0, 2.0, 4.0])
 
+    def test_import_dataframe(self, model: DataModel) -> None:
+        df = pd.DataFrame({"x 1": [0.0, 1.0, 3.0], 2: [0.0, 2.0, 4.0]})
+
+        model.import_dataframe(df)
+
+        assert model.get_column_names() == ["x_1", "_2"]
+        assert list(model.get_values(0, 1, 2, 1)) == pytest.approx([0.0, 2.0, 4.0])
+        # imported data frame is left untouched
+        assert list(df.columns) == ["x 1", 2]
+
     def test_merge_csv(self, simple_test_data: DataModel, tmp_path) -> None:
         data_path = tmp_path / "testdata.csv"
         data_path.write_text(
@@ -633,3 +752,15 @@ x,t,z
         )
         # col3 (z) is no longer calculated, but data from imported CSV
         assert simple_test_data.is_calculated_column("col3") is False
+
+    def test_merge_longer_dataframe_pads_columns(self, model: DataModel) -> None:
+        model.import_dataframe(pd.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]}))
+
+        model.merge_dataframe(pd.DataFrame({"x": [5.0, 6.0, 7.0]}))
+
+        assert model.get_column_names() == ["x", "y"]
+        assert list(model.get_column("col1")) == [5.0, 6.0, 7.0]
+        assert list(model.get_column("col2")) == pytest.approx(
+            [3.0, 4.0, np.nan], nan_ok=True
+        )
+        assert list(model._data.index) == [0, 1, 2]
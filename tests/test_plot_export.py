@@ -15,3 +15,13 @@ class TestPlotExport:
         plot.model.set_fit_domain_enabled(True)
 
         plot.export_graph(filepath)
+
+    def test_preview_graph(self, simple_project: MainWindow, mocker) -> None:
+        mocker.patch("PySide6.QtWidgets.QDialog.exec")
+        set_pixmap = mocker.patch("PySide6.QtWidgets.QLabel.setPixmap")
+        simple_project.ui.tabWidget.setCurrentIndex(2)
+
+        simple_project.preview_graph()
+
+        (pixmap,) = set_pixmap.call_args.args
+        assert not pixmap.isNull()
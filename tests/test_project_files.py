@@ -1,12 +1,12 @@
 import lmfit
 import numpy as np
 import pytest
-from PySide6 import QtWidgets
+from PySide6 import QtTest, QtWidgets
 from pytest_mock import MockerFixture
 
 import tailor.data_sheet
 from tailor import plot_model, project_files
-from tailor.app import MainWindow
+from tailor.app import TAB_REFRESH_DELAY, MainWindow
 from tailor.data_sheet import DataSheet
 from tailor.plot_model import PlotModel
 from tailor.plot_tab import DRAW_CURVE_OPTIONS, DrawCurve, PlotTab
@@ -126,6 +126,23 @@ class TestProjectFiles:
         data_sheet.model.beginResetModel.assert_called()
         data_sheet.model.endResetModel.assert_called()
 
+    def test_load_data_sheet_recalculates_columns(
+        self, data_sheet_model: project_files.Sheet, mocker: MockerFixture
+    ):
+        data_sheet = project_files.load_data_sheet(mocker.Mock(), data_sheet_model)
+        data_model = data_sheet.model.data_model
+
+        assert list(data_model.get_column("col3")) == pytest.approx(
+            [0.0, 0.02, 0.08, 0.18, 0.32, 0.50]
+        )
+        assert [data_model.is_column_valid_at(i) for i in range(5)] == [
+            True,
+            True,
+            True,
+            True,
+            False,
+        ]
+
     def test_save_plot(self, plot_tab: PlotTab):
         plot = project_files.save_plot(plot_tab)
         assert plot.id == 12345
@@ -184,6 +201,24 @@ class TestProjectFiles:
         plot_tab.refresh_ui()
         assert plot_tab.ui.xlabel.text() == "Time"
 
+    def test_load_plot_restores_options(
+        self,
+        plot_tab_model: project_files.Plot,
+        data_sheet: DataSheet,
+        mocker: MockerFixture,
+    ):
+        plot_tab_model.show_initial_fit = True
+
+        plot_tab = project_files.load_plot(
+            project=mocker.Mock(), model=plot_tab_model, data_sheet=data_sheet
+        )
+
+        assert plot_tab.ui.show_initial_fit.isChecked()
+        assert plot_tab.get_draw_curve_option() == DrawCurve.ON_DOMAIN
+        # signals are only blocked while restoring the options
+        assert not plot_tab.ui.show_initial_fit.signalsBlocked()
+        assert not plot_tab.ui.draw_curve_option.signalsBlocked()
+
     def test_save_project_to_model(self, simple_project: MainWindow):
         # simple_project.show()
         # QtWidgets.QApplication.instance().exec()
@@ -205,6 +240,8 @@ class TestProjectFiles:
         assert plot.data_sheet is sheet
         assert app.ui.tabWidget.currentIndex() == simple_project_model.current_tab
         app.ui.tabWidget.setCurrentWidget(plot)
+        # refreshing the plot tab is deferred to the event loop
+        QtTest.QTest.qWait(2 * TAB_REFRESH_DELAY)
         assert plot.model.best_fit is not None
         assert plot._params["a"].findChild(QtWidgets.QWidget, "value").value() == 2.0
 
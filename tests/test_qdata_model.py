@@ -84,7 +84,7 @@ class TestQtRequired:
     ):
         index = qmodel.createIndex(row, column)
         qmodel.data_model.get_value.return_value = value
-        qmodel.data_model.is_calculated_column.return_value = is_calculated
+        qmodel.data_model.is_calculated_column_at.return_value = is_calculated
 
         if not role:
             actual = qmodel.data(index)
@@ -100,16 +100,16 @@ class TestQtRequired:
         assert value is None
 
     @pytest.mark.parametrize("role", [QtCore.Qt.DisplayRole, QtCore.Qt.BackgroundRole])
-    def test_data_uses_column_label(self, qmodel: QDataModel, role):
+    def test_data_uses_column_index(self, qmodel: QDataModel, role):
         index = qmodel.createIndex(2, 1)
         qmodel.data_model.get_value.return_value = np.nan
-        qmodel.data_model.get_column_label.return_value = sentinel.label
 
         qmodel.data(index, role)
 
-        qmodel.data_model.is_calculated_column.assert_called_with(sentinel.label)
+        qmodel.data_model.get_column_label.assert_not_called()
+        qmodel.data_model.is_calculated_column_at.assert_called_with(1)
         if role == QtCore.Qt.BackgroundRole:
-            qmodel.data_model.is_column_valid.assert_called_with(sentinel.label)
+            qmodel.data_model.is_column_valid_at.assert_called_with(1)
 
     def test_headerData_for_columns(self, qmodel: QDataModel):
         qmodel.data_model.get_column_label.return_value = sentinel.label
@@ -149,8 +149,7 @@ class TestQtRequired:
 
     @pytest.mark.parametrize("is_calculated", [True, False])
     def test_flags(self, qmodel: QDataModel, is_calculated):
-        qmodel.data_model.get_column_label.return_value = sentinel.label
-        qmodel.data_model.is_calculated_column.return_value = is_calculated
+        qmodel.data_model.is_calculated_column_at.return_value = is_calculated
         expected = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
         if not is_calculated:
             expected |= QtCore.Qt.ItemIsEditable
@@ -158,8 +157,7 @@ class TestQtRequired:
         index = qmodel.createIndex(2, 123)
         flags = qmodel.flags(index)
 
-        qmodel.data_model.get_column_label.assert_called_with(123)
-        qmodel.data_model.is_calculated_column.assert_called_once_with(sentinel.label)
+        qmodel.data_model.is_calculated_column_at.assert_called_once_with(123)
         assert flags == expected
 
     def test_insertRows(self, qmodel: QDataModel, mocker: MockerFixture):
@@ -353,13 +351,11 @@ class TestAPI:
         assert new_name == sentinel.new_name
 
     def test_isCalculatedColumn(self, qmodel: QDataModel):
-        qmodel.data_model.get_column_label.return_value = sentinel.label
-        qmodel.data_model.is_calculated_column.return_value = sentinel.is_calculated
+        qmodel.data_model.is_calculated_column_at.return_value = sentinel.is_calculated
 
         actual = qmodel.isCalculatedColumn(sentinel.idx)
 
-        qmodel.data_model.get_column_label.assert_called_with(sentinel.idx)
-        qmodel.data_model.is_calculated_column.assert_called_with(sentinel.label)
+        qmodel.data_model.is_calculated_column_at.assert_called_with(sentinel.idx)
         assert actual == sentinel.is_calculated
 
     def test_columnExpression(self, qmodel: QDataModel):
@@ -433,7 +429,6 @@ class TestAPI:
         qmodel.columnCount.return_value = 10
         topleft1 = qmodel.createIndex(0, 1)
         bottomright1 = qmodel.createIndex(2, 3)
-        bottomfarright1 = qmodel.createIndex(2, 10 - 1)
         topleft2 = qmodel.createIndex(4, 5)
         bottomright2 = qmodel.createIndex(6, 7)
         bottomfarright2 = qmodel.createIndex(6, 10 - 1)
@@ -443,8 +438,8 @@ class TestAPI:
 
         qmodel.clearData(selection)
 
-        expected = [call(topleft1, bottomfarright1), call(topleft2, bottomfarright2)]
-        assert qmodel.dataChanged.emit.call_args_list == expected
+        # a single signal for the bounding rectangle of all ranges
+        qmodel.dataChanged.emit.assert_called_once_with(topleft1, bottomfarright2)
 
     def test_dataFromSelection(self, qmodel: QDataModel, mocker: MockerFixture):
         """Test copying data from a selection.